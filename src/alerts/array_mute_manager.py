@@ -14,6 +14,18 @@ class ArrayMuteManager(BaseMuteManager):
     # Use a single key for the array mute
     _KEY = "array"
 
+    # Key used by the earlier single-expiry file format
+    _LEGACY_KEY = "mute_until"
+
+    def _load(self) -> None:
+        """Load mutes, migrating the legacy {"mute_until": ...} format."""
+        super()._load()
+
+        legacy_expiry = self._mutes.pop(self._LEGACY_KEY, None)
+        if legacy_expiry is not None:
+            self._set_expiry(self._KEY, legacy_expiry)
+            self._save()
+
     def is_array_muted(self) -> bool:
         """Check if array/disk alerts are currently muted."""
         return self._is_muted(self._KEY)
@@ -21,7 +33,7 @@ class ArrayMuteManager(BaseMuteManager):
     def mute_array(self, duration: timedelta) -> datetime:
         """Mute array/disk alerts for the specified duration."""
         expiry = self._add_mute(self._KEY, duration)
-        logger.info(f"Muted array alerts until {expiry}")
+        logger.info("Muted array alerts until %s", expiry)
         return expiry
 
     def unmute_array(self) -> bool:
@@ -33,12 +45,5 @@ class ArrayMuteManager(BaseMuteManager):
 
     def get_mute_expiry(self) -> datetime | None:
         """Get the mute expiry time."""
-        if self._KEY not in self._mutes:
-            return None
-
-        if datetime.now() >= self._mutes[self._KEY]:
-            del self._mutes[self._KEY]
-            self._save()
-            return None
-
-        return self._mutes[self._KEY]
+        expiry = self._get_expiry(self._KEY)
+        return datetime.fromtimestamp(expiry) if expiry is not None else None
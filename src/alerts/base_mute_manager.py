@@ -1,17 +1,22 @@
 """Base class for mute managers with shared persistence logic."""
 
+import heapq
 import json
 import logging
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from src.utils.persistence import DebouncedSaver, dumps_json, loads_json
+
 logger = logging.getLogger(__name__)
 
 
 class BaseMuteManager:
     """Base class providing JSON persistence for mute state.
 
-    Subclasses use a dict[str, datetime] mapping keys to expiry times.
+    Subclasses use a dict[str, float] mapping keys to expiry times as POSIX
+    timestamps. Expiries are converted to datetime only at the public API.
     """
 
     def __init__(self, json_path: str):
@@ -21,24 +26,33 @@ class BaseMuteManager:
             json_path: Path to JSON file for persistence.
         """
         self._json_path = Path(json_path)
-        self._mutes: dict[str, datetime] = {}
+        self._json_path.parent.mkdir(parents=True, exist_ok=True)
+        self._mutes: dict[str, float] = {}
+        # Min-heap of (expiry, key); entries made stale by removal or
+        # re-muting are skipped lazily when popped
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._saver = DebouncedSaver(self._json_path, self._encode)
         self._load()
 
-    def _is_muted(self, key: str) -> bool:
-        """Check if a key is currently muted.
+    @staticmethod
+    def _now() -> float:
+        """Get the current time as a POSIX timestamp."""
+        return time.time()
 
-        Returns False if mute has expired, cleaning up the expired entry.
-        """
-        if key not in self._mutes:
-            return False
+    def _get_expiry(self, key: str) -> float | None:
+        """Get the expiry timestamp for an active mute.
 
-        expiry = self._mutes[key]
-        if datetime.now() >= expiry:
-            del self._mutes[key]
-            self._save()
-            return False
+        Returns None if the key is not muted or the mute has expired. This
+        is a pure read; expired entries are reclaimed by _clean_expired.
+        """
+        expiry = self._mutes.get(key)
+        if expiry is None or self._now() >= expiry:
+            return None
+        return expiry
 
-        return True
+    def _is_muted(self, key: str) -> bool:
+        """Check if a key is currently muted."""
+        return self._get_expiry(key) is not None
 
     def _add_mute(self, key: str, duration: timedelta) -> datetime:
         """Add a mute for a key.
@@ -50,21 +64,27 @@ class BaseMuteManager:
         Returns:
             Expiry datetime.
         """
-        expiry = datetime.now() + duration
-        self._mutes[key] = expiry
+        self._clean_expired()
+        expiry = self._now() + duration.total_seconds()
+        self._set_expiry(key, expiry)
         self._save()
-        return expiry
+        return datetime.fromtimestamp(expiry)
+
+    def _set_expiry(self, key: str, expiry: float) -> None:
+        """Record a mute expiry and index it for cleanup."""
+        self._mutes[key] = expiry
+        heapq.heappush(self._expiry_heap, (expiry, key))
 
     def _remove_mute(self, key: str) -> bool:
         """Remove a mute early.
 
         Returns:
-            True if mute was removed, False if not found.
+            True if mute was removed, False if not found or already expired.
         """
-        if key not in self._mutes:
+        self._clean_expired()
+        if self._mutes.pop(key, None) is None:
             return False
 
-        del self._mutes[key]
         self._save()
         return True
 
@@ -75,15 +95,23 @@ class BaseMuteManager:
             List of (key, expiry) tuples.
         """
         self._clean_expired()
-        return [(key, exp) for key, exp in self._mutes.items()]
+        return [(key, datetime.fromtimestamp(exp)) for key, exp in self._mutes.items()]
 
     def _clean_expired(self) -> None:
-        """Remove expired mutes."""
-        now = datetime.now()
-        expired = [key for key, exp in self._mutes.items() if now >= exp]
-        for key in expired:
-            del self._mutes[key]
-        if expired:
+        """Remove expired mutes.
+
+        Only entries at the top of the expiry heap are examined, so cost is
+        proportional to the number of expired mutes rather than all mutes.
+        """
+        now = self._now()
+        heap = self._expiry_heap
+        changed = False
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            if self._mutes.get(key) == expiry:
+                del self._mutes[key]
+                changed = True
+        if changed:
             self._save()
 
     def _load(self) -> None:
@@ -93,26 +121,47 @@ class BaseMuteManager:
             return
 
         try:
-            with open(self._json_path, encoding="utf-8") as f:
-                data = json.load(f)
-                self._mutes = {
-                    key: datetime.fromisoformat(exp)
-                    for key, exp in data.items()
-                }
+            payload = self._json_path.read_bytes()
+            self._saver.mark_persisted(payload)
+            data = loads_json(payload)
+            self._mutes = {
+                key: self._parse_expiry(exp)
+                for key, exp in data.items()
+            }
         except (json.JSONDecodeError, IOError, ValueError) as e:
-            logger.warning(f"Failed to load mutes from {self._json_path}: {e}")
+            logger.warning("Failed to load mutes from %s: %s", self._json_path, e)
             self._mutes = {}
 
+        self._expiry_heap = [(exp, key) for key, exp in self._mutes.items()]
+        heapq.heapify(self._expiry_heap)
+
+    @staticmethod
+    def _parse_expiry(value: float | int | str) -> float:
+        """Parse a stored expiry into a POSIX timestamp.
+
+        Older files stored ISO-format datetime strings; these are still
+        accepted.
+
+        Raises:
+            ValueError: If the value is not a number or ISO datetime.
+        """
+        if isinstance(value, str):
+            return datetime.fromisoformat(value).timestamp()
+        if isinstance(value, (int, float)):
+            return float(value)
+        raise ValueError(f"Invalid mute expiry: {value!r}")
+
+    def flush(self) -> None:
+        """Write any pending mute changes to disk immediately."""
+        self._saver.flush()
+
     def _save(self) -> None:
-        """Save mutes to JSON file."""
-        self._json_path.parent.mkdir(parents=True, exist_ok=True)
+        """Schedule a save of mutes to the JSON file.
 
-        try:
-            data = {
-                key: exp.isoformat()
-                for key, exp in self._mutes.items()
-            }
-            with open(self._json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
-            logger.error(f"Failed to save mutes to {self._json_path}: {e}")
+        Writes are debounced so bursts of changes result in a single write.
+        """
+        self._saver.request()
+
+    def _encode(self) -> bytes:
+        """Serialize mutes for the JSON file."""
+        return dumps_json(self._mutes)
@@ -1,15 +1,18 @@
 import json
 import logging
 import re
-from dataclasses import dataclass, asdict
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
+from src.utils.persistence import DebouncedSaver, dumps_json, loads_json
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class IgnorePattern:
     """Represents an ignore pattern with metadata."""
 
@@ -17,18 +20,42 @@ class IgnorePattern:
     match_type: Literal["substring", "regex"] = "substring"
     explanation: str | None = None
     added: str | None = None  # ISO timestamp
+    _pattern_lower: str = field(init=False, repr=False, compare=False)
+    _compiled: re.Pattern[str] | None = field(default=None, init=False, repr=False, compare=False)
 
-    def matches(self, message: str) -> bool:
-        """Check if this pattern matches the given message."""
+    def __post_init__(self) -> None:
+        self._pattern_lower = self.pattern.lower()
         if self.match_type == "regex":
             try:
-                return bool(re.search(self.pattern, message, re.IGNORECASE))
+                self._compiled = re.compile(self.pattern, re.IGNORECASE)
             except re.error:
                 logger.warning(f"Invalid regex pattern: {self.pattern}")
-                return False
+
+    def matches(self, message: str, message_lower: str | None = None) -> bool:
+        """Check if this pattern matches the given message.
+
+        Args:
+            message: The log message to check.
+            message_lower: Optional pre-lowercased message, so callers checking
+                many patterns only lowercase the message once.
+        """
+        if self.match_type == "regex":
+            # Invalid regexes were logged at construction and never match
+            return self._compiled is not None and self._compiled.search(message) is not None
         else:
             # Substring match (case-insensitive)
-            return self.pattern.lower() in message.lower()
+            if message_lower is None:
+                message_lower = message.lower()
+            return self._pattern_lower in message_lower
+
+    def to_dict(self) -> dict[str, str | None]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "pattern": self.pattern,
+            "match_type": self.match_type,
+            "explanation": self.explanation,
+            "added": self.added,
+        }
 
 
 class IgnoreManager:
@@ -41,26 +68,117 @@ class IgnoreManager:
             config_ignores: Per-container ignore patterns from config.yaml.
             json_path: Path to runtime ignores JSON file.
         """
-        self._config_ignores = config_ignores
+        # Container names are interned to share the objects the Docker
+        # monitor uses for the same names
+        self._config_ignores = {
+            sys.intern(container): patterns for container, patterns in config_ignores.items()
+        }
+        self._config_ignores_lower: dict[str, list[str]] = {
+            container: [p.lower() for p in patterns]
+            for container, patterns in self._config_ignores.items()
+        }
         self._json_path = Path(json_path)
+        self._json_path.parent.mkdir(parents=True, exist_ok=True)
         self._runtime_ignores: dict[str, list[IgnorePattern]] = {}
+        # Per-container matchers built lazily from config + runtime patterns
+        self._substrings: dict[str, tuple[str, ...]] = {}
+        self._regexes: dict[str, list[re.Pattern[str]]] = {}
+        self._matchers_dirty = True
+        # Sorted names of containers with any ignores, built lazily
+        self._containers: tuple[str, ...] | None = None
+        self._saver = DebouncedSaver(self._json_path, self._encode_runtime_ignores)
         self._load_runtime_ignores()
 
     def is_ignored(self, container: str, message: str) -> bool:
         """Check if message should be ignored."""
-        # Check config ignores (always substring, case-insensitive)
-        message_lower = message.lower()
-        for pattern in self._config_ignores.get(container, []):
-            if pattern.lower() in message_lower:
+        if self._matchers_dirty:
+            self._rebuild_matchers()
+
+        substrings = self._substrings.get(container)
+        regexes = self._regexes.get(container)
+
+        # Most containers have no ignores; skip lowercasing the message
+        if not substrings and not regexes:
+            return False
+
+        # All substring patterns (config and runtime) are case-insensitive
+        if substrings:
+            message_lower = message.lower()
+            if any(p in message_lower for p in substrings):
                 return True
 
-        # Check runtime ignores (can be regex or substring)
-        for ignore_pattern in self._runtime_ignores.get(container, []):
-            if ignore_pattern.matches(message):
+        # Runtime regex patterns
+        for regex in regexes or ():
+            if regex.search(message):
                 return True
 
         return False
 
+    def _invalidate_matchers(self) -> None:
+        """Mark the per-container matchers as stale after a pattern change."""
+        self._matchers_dirty = True
+        self._containers = None
+
+    def _rebuild_matchers(self) -> None:
+        """Merge config and runtime patterns into per-container matchers.
+
+        Substring patterns from both sources are combined into a single
+        deduplicated tuple per container so each message is scanned by one
+        loop; regex patterns are compiled into a single alternation.
+        """
+        substrings: dict[str, tuple[str, ...]] = {}
+        regexes: dict[str, list[re.Pattern[str]]] = {}
+
+        for container in self._config_ignores_lower.keys() | self._runtime_ignores.keys():
+            lowered = list(self._config_ignores_lower.get(container, []))
+            regex_patterns: list[IgnorePattern] = []
+            for ignore_pattern in self._runtime_ignores.get(container, []):
+                if ignore_pattern.match_type == "regex":
+                    regex_patterns.append(ignore_pattern)
+                else:
+                    lowered.append(ignore_pattern._pattern_lower)
+            if lowered:
+                substrings[container] = tuple(dict.fromkeys(lowered))
+            if regex_patterns:
+                regexes[container] = self._compile_regexes(regex_patterns)
+
+        self._substrings = substrings
+        self._regexes = regexes
+        self._matchers_dirty = False
+
+    @staticmethod
+    def _compile_regexes(patterns: list[IgnorePattern]) -> list[re.Pattern[str]]:
+        """Compile regex ignore patterns, combining them where safe.
+
+        Patterns without capture groups are joined into one alternation so a
+        message is searched once. Patterns with groups are compiled on their
+        own because group numbers (and backreferences) would shift inside an
+        alternation. Invalid patterns (already logged when the IgnorePattern
+        was created) are skipped.
+
+        Patterns that cannot be combined (e.g. leading inline flags) fall
+        back to one compiled pattern each.
+        """
+        combinable: list[re.Pattern[str]] = []
+        separate: list[re.Pattern[str]] = []
+        for ignore_pattern in patterns:
+            compiled = ignore_pattern._compiled
+            if compiled is None:
+                continue
+            if compiled.groups:
+                separate.append(compiled)
+            else:
+                combinable.append(compiled)
+
+        if len(combinable) > 1:
+            union = "|".join(f"(?:{compiled.pattern})" for compiled in combinable)
+            try:
+                return [re.compile(union, re.IGNORECASE), *separate]
+            except re.error:
+                # e.g. global inline flags are only valid at the pattern start
+                pass
+        return combinable + separate
+
     def add_ignore_pattern(
         self,
         container: str,
@@ -83,8 +201,9 @@ class IgnoreManager:
             self._runtime_ignores[container] = []
 
         # Check if already exists (by pattern string, case-insensitive)
+        pattern_lower = pattern.lower()
         for existing in self._runtime_ignores[container]:
-            if existing.pattern.lower() == pattern.lower():
+            if existing._pattern_lower == pattern_lower:
                 return False
 
         ignore_pattern = IgnorePattern(
@@ -94,6 +213,7 @@ class IgnoreManager:
             added=datetime.now().isoformat(),
         )
         self._runtime_ignores[container].append(ignore_pattern)
+        self._invalidate_matchers()
         self._save_runtime_ignores()
         logger.info(f"Added ignore for {container}: {pattern} ({match_type})")
         return True
@@ -145,6 +265,15 @@ class IgnoreManager:
 
         return ignores
 
+    def get_containers(self) -> tuple[str, ...]:
+        """Get containers with config or runtime ignores, sorted by name.
+
+        The result is cached until the ignores change.
+        """
+        if self._containers is None:
+            self._containers = tuple(sorted(self._config_ignores.keys() | self._runtime_ignores.keys()))
+        return self._containers
+
     def get_containers_with_runtime_ignores(self) -> list[str]:
         """Get list of containers that have runtime ignores.
 
@@ -157,6 +286,19 @@ class IgnoreManager:
             if patterns
         ]
 
+    def get_runtime_ignore_counts(self) -> dict[str, int]:
+        """Get the number of runtime ignores per container.
+
+        Returns:
+            Dict of container name to count, for containers with at least
+            one runtime ignore.
+        """
+        return {
+            container: len(patterns)
+            for container, patterns in self._runtime_ignores.items()
+            if patterns
+        }
+
     def remove_runtime_ignore(self, container: str, index: int) -> bool:
         """Remove a runtime ignore by index.
 
@@ -181,6 +323,7 @@ class IgnoreManager:
         if not patterns:
             del self._runtime_ignores[container]
 
+        self._invalidate_matchers()
         self._save_runtime_ignores()
         return True
 
@@ -189,13 +332,15 @@ class IgnoreManager:
 
         Handles both old format (list of strings) and new format (list of objects).
         """
+        self._invalidate_matchers()
         if not self._json_path.exists():
             self._runtime_ignores = {}
             return
 
         try:
-            with open(self._json_path, encoding="utf-8") as f:
-                data = json.load(f)
+            payload = self._json_path.read_bytes()
+            self._saver.mark_persisted(payload)
+            data = loads_json(payload)
 
             self._runtime_ignores = {}
             for container, patterns in data.items():
@@ -216,22 +361,25 @@ class IgnoreManager:
                                 added=item.get("added"),
                             )
                         )
-        except (json.JSONDecodeError, IOError) as e:
+        except (json.JSONDecodeError, IOError, ValueError) as e:
             logger.warning(f"Failed to load runtime ignores: {e}")
             self._runtime_ignores = {}
 
+    def flush(self) -> None:
+        """Write any pending runtime ignore changes to disk immediately."""
+        self._saver.flush()
+
     def _save_runtime_ignores(self) -> None:
-        """Save runtime ignores to JSON file in new format."""
-        # Ensure parent directory exists
-        self._json_path.parent.mkdir(parents=True, exist_ok=True)
+        """Schedule a save of runtime ignores.
 
-        # Convert to serializable format
-        data = {}
-        for container, patterns in self._runtime_ignores.items():
-            data[container] = [asdict(p) for p in patterns]
+        Writes are debounced so bursts of changes result in a single write.
+        """
+        self._saver.request()
 
-        try:
-            with open(self._json_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
-            logger.error(f"Failed to save runtime ignores: {e}")
+    def _encode_runtime_ignores(self) -> bytes:
+        """Serialize runtime ignores for the JSON file in new format."""
+        data = {
+            container: [p.to_dict() for p in patterns]
+            for container, patterns in self._runtime_ignores.items()
+        }
+        return dumps_json(data)
@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import re
+from typing import Awaitable, Iterable
+
 from aiogram import Bot
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 from aiogram.exceptions import TelegramRetryAfter, TelegramAPIError
@@ -8,6 +12,63 @@ from src.utils.telegram_retry import send_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Telegram limits inline button callback_data to 64 bytes
+CALLBACK_DATA_MAX_BYTES = 64
+IGNORE_SIMILAR_PREFIX = "ignore_similar:"
+
+# Cap on alerts sent at once; Telegram allows roughly 30 messages/second
+MAX_CONCURRENT_SENDS = 20
+
+# Human-readable explanations for common container exit codes
+EXIT_REASONS = {
+    137: " (OOM killed)",
+    143: " (SIGTERM)",
+    139: " (segfault)",
+}
+
+CRASH_ALERT_TEMPLATE = """🔴 *CONTAINER CRASHED:* {name}
+
+Exit code: {exit_code}{exit_reason}
+Image: `{image}`
+Uptime: {uptime}"""
+
+LOG_ERROR_ALERT_TEMPLATE = """⚠️ *ERRORS IN:* {name}
+
+{count_text}
+
+Latest: `{error}`
+
+/logs {name} 50 - View last 50 lines"""
+
+# Header line of crash and log error alerts, as sent (with Markdown) or as
+# returned by Telegram in a reply (entities stripped). Anchored so only the
+# start of the message is examined, never the body; case-sensitive because
+# the templates above always emit the header in uppercase.
+ALERT_HEADER_PATTERN = re.compile(r"\W*(ERRORS IN|CONTAINER CRASHED)[:*\s]+(\w+)")
+ALERT_KIND_ERRORS = "ERRORS IN"
+ALERT_KIND_CRASH = "CONTAINER CRASHED"
+
+RESOURCE_ALERT_TEMPLATE = """⚠️ *{title}:* {name}
+
+{primary}
+Exceeded for: {duration}
+
+{secondary}"""
+
+
+def parse_alert_header(text: str) -> tuple[str, str] | None:
+    """Parse the header of a crash or log error alert.
+
+    Returns:
+        Tuple of (alert kind, container name), where kind is
+        ALERT_KIND_ERRORS or ALERT_KIND_CRASH, or None if the text does not
+        start with one of those headers.
+    """
+    match = ALERT_HEADER_PATTERN.match(text)
+    if not match:
+        return None
+    return match.group(1), match.group(2)
+
 
 class ChatIdStore:
     """Simple in-memory storage for the alert chat ID."""
@@ -34,6 +95,61 @@ def format_uptime(seconds: int) -> str:
     return f"{minutes}m"
 
 
+async def send_many(
+    alerts: Iterable[Awaitable[None]],
+    max_concurrent: int = MAX_CONCURRENT_SENDS,
+) -> None:
+    """Send several alerts concurrently.
+
+    Alerts in a burst (e.g. many containers crossing a threshold in the same
+    poll) are sent in parallel instead of one after another, with at most
+    max_concurrent requests in flight. A failure in one alert does not
+    prevent the others from being sent.
+
+    Args:
+        alerts: Awaitables returned by the send_*_alert methods.
+        max_concurrent: Maximum number of alerts sent at the same time.
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _send(alert: Awaitable[None]) -> None:
+        async with semaphore:
+            await alert
+
+    results = await asyncio.gather(*(_send(alert) for alert in alerts), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Failed to send alert: {result}")
+
+
+def _log_error_keyboard(container_name: str, error_line: str) -> InlineKeyboardMarkup:
+    """Build the quick action keyboard for a log error alert.
+
+    The error is embedded in the "Ignore Similar" callback data, truncated
+    with a single slice so the whole payload fits Telegram's 64-byte limit.
+    """
+    prefix = f"{IGNORE_SIMILAR_PREFIX}{container_name}:"
+    max_error_len = CALLBACK_DATA_MAX_BYTES - len(prefix)
+    if error_line.isascii():
+        error_preview = error_line[:max_error_len]
+    else:
+        # Slice by bytes so multi-byte characters cannot overflow the limit
+        error_preview = error_line.encode("utf-8")[:max_error_len].decode("utf-8", "ignore")
+
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(text="🔇 Ignore Similar", callback_data=prefix + error_preview),
+                InlineKeyboardButton(text="🔕 Mute 1h", callback_data=f"mute:{container_name}:60"),
+            ],
+            [
+                InlineKeyboardButton(text="📋 Logs", callback_data=f"logs:{container_name}:50"),
+                InlineKeyboardButton(text="🔍 Diagnose", callback_data=f"diagnose:{container_name}"),
+            ],
+        ]
+    )
+
+
 class AlertManager:
     """Manages sending alerts to Telegram."""
 
@@ -52,20 +168,13 @@ class AlertManager:
         """Send a container crash alert with quick action buttons."""
         uptime_str = format_uptime(uptime_seconds) if uptime_seconds else "unknown"
 
-        # Interpret common exit codes
-        exit_reason = ""
-        if exit_code == 137:
-            exit_reason = " (OOM killed)"
-        elif exit_code == 143:
-            exit_reason = " (SIGTERM)"
-        elif exit_code == 139:
-            exit_reason = " (segfault)"
-
-        text = f"""🔴 *CONTAINER CRASHED:* {container_name}
-
-Exit code: {exit_code}{exit_reason}
-Image: `{image}`
-Uptime: {uptime_str}"""
+        text = CRASH_ALERT_TEMPLATE.format(
+            name=container_name,
+            exit_code=exit_code,
+            exit_reason=EXIT_REASONS.get(exit_code, ""),
+            image=image,
+            uptime=uptime_str,
+        )
 
         # Quick action buttons
         keyboard = InlineKeyboardMarkup(
@@ -107,6 +216,10 @@ Uptime: {uptime_str}"""
         """Send a log error alert with ignore button."""
         total_errors = suppressed_count + 1
 
+        # Bound pathological log lines up front; nothing below needs more
+        # than the display length (+1 to detect truncation) or callback size
+        error_line = error_line[:max(self.error_display_max_chars + 1, CALLBACK_DATA_MAX_BYTES)]
+
         # Truncate long error lines for display
         display_error = error_line
         if len(error_line) > self.error_display_max_chars:
@@ -117,33 +230,14 @@ Uptime: {uptime_str}"""
         else:
             count_text = "New error detected"
 
-        text = f"""⚠️ *ERRORS IN:* {container_name}
-
-{count_text}
-
-Latest: `{display_error}`
-
-/logs {container_name} 50 - View last 50 lines"""
-
-        # Create inline keyboard with quick action buttons
-        # Truncate error in callback data (max 64 bytes for callback_data)
-        prefix = f"ignore_similar:{container_name}:"
-        max_error_len = 64 - len(prefix)
-        error_preview = error_line[:max_error_len] if len(error_line) > max_error_len else error_line
-
-        keyboard = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton(text="🔇 Ignore Similar", callback_data=f"{prefix}{error_preview}"),
-                    InlineKeyboardButton(text="🔕 Mute 1h", callback_data=f"mute:{container_name}:60"),
-                ],
-                [
-                    InlineKeyboardButton(text="📋 Logs", callback_data=f"logs:{container_name}:50"),
-                    InlineKeyboardButton(text="🔍 Diagnose", callback_data=f"diagnose:{container_name}"),
-                ],
-            ]
+        text = LOG_ERROR_ALERT_TEMPLATE.format(
+            name=container_name,
+            count_text=count_text,
+            error=display_error,
         )
 
+        keyboard = _log_error_keyboard(container_name, error_line)
+
         try:
             await send_with_retry(
                 self.bot.send_message,
@@ -199,12 +293,13 @@ Latest: `{display_error}`
             primary += f"\n        {memory_display} / {memory_limit_display} limit"
             secondary = f"CPU: {cpu_percent}% (normal)"
 
-        text = f"""⚠️ *{title}:* {container_name}
-
-{primary}
-Exceeded for: {duration_str}
-
-{secondary}"""
+        text = RESOURCE_ALERT_TEMPLATE.format(
+            title=title,
+            name=container_name,
+            primary=primary,
+            duration=duration_str,
+            secondary=secondary,
+        )
 
         # Quick action buttons
         keyboard = InlineKeyboardMarkup(
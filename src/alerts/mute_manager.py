@@ -3,6 +3,7 @@
 import re
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from src.alerts.base_mute_manager import BaseMuteManager
 
@@ -11,9 +12,13 @@ logger = logging.getLogger(__name__)
 DURATION_PATTERN = re.compile(r"^(\d+)(m|h)$")
 
 
+@lru_cache(maxsize=64)
 def parse_duration(text: str) -> timedelta | None:
     """Parse duration string like '15m' or '2h'.
 
+    Results are cached; the set of durations users type is small and
+    timedelta is immutable.
+
     Args:
         text: Duration string (e.g., '15m', '2h', '24h').
 
@@ -51,14 +56,14 @@ class MuteManager(BaseMuteManager):
     def add_mute(self, container: str, duration: timedelta) -> datetime:
         """Add a mute for container."""
         expiry = self._add_mute(container, duration)
-        logger.info(f"Muted {container} until {expiry}")
+        logger.info("Muted %s until %s", container, expiry)
         return expiry
 
     def remove_mute(self, container: str) -> bool:
         """Remove a mute early."""
         removed = self._remove_mute(container)
         if removed:
-            logger.info(f"Unmuted {container}")
+            logger.info("Unmuted %s", container)
         return removed
 
     def get_active_mutes(self) -> list[tuple[str, datetime]]:
@@ -1,4 +1,18 @@
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass
+
+# How often idle entries are swept, in seconds
+SWEEP_INTERVAL = 300.0
+# Entries idle for this many cooldowns are dropped by the sweep
+SWEEP_AGE_COOLDOWNS = 4
+
+
+@dataclass(slots=True)
+class _AlertEntry:
+    """Rate limiting state for one alert key."""
+
+    last_alert: float | None = None  # time.monotonic() of last sent alert
+    suppressed: int = 0
 
 
 class RateLimiter:
@@ -6,28 +20,61 @@ class RateLimiter:
 
     def __init__(self, cooldown_seconds: int = 900):
         self.cooldown_seconds = cooldown_seconds
-        self._last_alert: dict[str, datetime] = {}
-        self._suppressed_count: dict[str, int] = {}
+        self._cooldown = float(cooldown_seconds)
+        # Monotonic timestamps, immune to wall-clock adjustments
+        self._entries: dict[str, _AlertEntry] = {}
+        self._last_sweep = time.monotonic()
 
     def should_alert(self, container_name: str) -> bool:
         """Check if an alert should be sent for this container."""
-        last = self._last_alert.get(container_name)
-        if last is None:
+        entry = self._entries.get(container_name)
+        if entry is None or entry.last_alert is None:
             return True
-
-        elapsed = datetime.now() - last
-        return elapsed >= timedelta(seconds=self.cooldown_seconds)
+        return time.monotonic() - entry.last_alert >= self._cooldown
 
     def record_alert(self, container_name: str) -> None:
         """Record that an alert was sent."""
-        self._last_alert[container_name] = datetime.now()
-        self._suppressed_count[container_name] = 0
+        now = time.monotonic()
+        entry = self._entries.get(container_name)
+        if entry is None:
+            self._entries[container_name] = _AlertEntry(last_alert=now)
+        else:
+            entry.last_alert = now
+            entry.suppressed = 0
+        self._maybe_sweep(now)
 
     def record_suppressed(self, container_name: str) -> None:
         """Record that an alert was suppressed."""
-        current = self._suppressed_count.get(container_name, 0)
-        self._suppressed_count[container_name] = current + 1
+        entry = self._entries.get(container_name)
+        if entry is None:
+            self._entries[container_name] = _AlertEntry(suppressed=1)
+        else:
+            entry.suppressed += 1
+        self._maybe_sweep(time.monotonic())
 
     def get_suppressed_count(self, container_name: str) -> int:
         """Get count of suppressed alerts since last sent alert."""
-        return self._suppressed_count.get(container_name, 0)
+        entry = self._entries.get(container_name)
+        return entry.suppressed if entry is not None else 0
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Drop entries for keys that have gone quiet.
+
+        Runs at most once per SWEEP_INTERVAL so the cost is amortized over
+        many calls. An entry is dropped once its last alert is more than
+        SWEEP_AGE_COOLDOWNS cooldowns old and it has no suppressed alerts;
+        entries with a suppressed count are kept so the next alert can
+        still report it.
+        """
+        if now - self._last_sweep < SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+
+        cutoff = now - self._cooldown * SWEEP_AGE_COOLDOWNS
+        dead = [
+            key for key, entry in self._entries.items()
+            if entry.suppressed == 0
+            and (entry.last_alert is None or entry.last_alert < cutoff)
+        ]
+        for key in dead:
+            del self._entries[key]
@@ -1,68 +1,88 @@
 import threading
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
 
-
-@dataclass
-class RecentError:
-    """A recent error with timestamp."""
-    message: str
-    timestamp: datetime
+# Number of locks shared across containers (must be a power of two)
+LOCK_STRIPES = 16
 
 
 class RecentErrorsBuffer:
     """Buffer to track recent errors per container.
 
+    Errors are deduplicated on insertion: each container keeps an ordered
+    mapping of message to the time it was last seen, oldest first.
+
     Thread-safe: This class is accessed from multiple threads (log watcher
-    adds errors, Telegram handlers read errors).
+    adds errors, Telegram handlers read errors). Containers are spread over
+    a fixed set of striped locks so unrelated containers do not contend.
     """
 
     def __init__(self, max_age_seconds: int = 900, max_per_container: int = 50):
         self.max_age_seconds = max_age_seconds
         self.max_per_container = max_per_container
-        self._errors: dict[str, list[RecentError]] = {}
-        self._lock = threading.Lock()
+        # Message -> time.monotonic() it was last seen
+        self._errors: dict[str, OrderedDict[str, float]] = {}
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+    def _lock_for(self, container: str) -> threading.Lock:
+        """Get the lock stripe guarding a container's errors."""
+        return self._locks[hash(container) & (LOCK_STRIPES - 1)]
 
     def add(self, container: str, message: str) -> None:
         """Add an error to the buffer."""
-        with self._lock:
-            if container not in self._errors:
-                self._errors[container] = []
+        with self._lock_for(container):
+            # setdefault is atomic, so containers on other stripes can be
+            # added concurrently
+            errors = self._errors.get(container)
+            if errors is None:
+                errors = self._errors.setdefault(container, OrderedDict())
 
-            self._errors[container].append(
-                RecentError(message=message, timestamp=datetime.now())
-            )
+            # Re-seen messages move to the newest end with a fresh timestamp
+            errors[message] = time.monotonic()
+            errors.move_to_end(message)
+            while len(errors) > self.max_per_container:
+                errors.popitem(last=False)
 
-            # Prune old entries and cap at max
+            # Prune old entries
             self._prune_unlocked(container)
 
     def get_recent(self, container: str) -> list[str]:
-        """Get unique recent error messages for a container."""
-        with self._lock:
+        """Get unique recent error messages for a container, oldest first."""
+        with self._lock_for(container):
             if container not in self._errors:
                 return []
 
             self._prune_unlocked(container)
+            return list(self._errors[container])
+
+    def find_by_prefix(self, container: str, prefix: str) -> str | None:
+        """Find the oldest recent error message starting with prefix.
 
-            # Return unique messages, preserving order of first occurrence
-            seen = set()
-            unique = []
-            for error in self._errors[container]:
-                if error.message not in seen:
-                    seen.add(error.message)
-                    unique.append(error.message)
-            return unique
+        Used to recover a full message from the truncated preview carried
+        in button callback data, without copying the container's errors.
+        """
+        with self._lock_for(container):
+            if container not in self._errors:
+                return None
+
+            self._prune_unlocked(container)
+            for message in self._errors[container]:
+                if message.startswith(prefix):
+                    return message
+            return None
 
     def _prune_unlocked(self, container: str) -> None:
-        """Remove old entries and cap at max.
+        """Remove messages not seen within max_age_seconds.
+
+        Messages are ordered by when they were last seen, so expired ones
+        are always at the front and pruning only touches those.
 
-        Note: Must be called with self._lock held.
+        Note: Must be called with the container's lock stripe held.
         """
-        if container not in self._errors:
+        errors = self._errors.get(container)
+        if not errors:
             return
 
-        cutoff = datetime.now() - timedelta(seconds=self.max_age_seconds)
-        self._errors[container] = [
-            e for e in self._errors[container]
-            if e.timestamp > cutoff
-        ][-self.max_per_container:]
+        cutoff = time.monotonic() - self.max_age_seconds
+        while errors and next(iter(errors.values())) <= cutoff:
+            errors.popitem(last=False)
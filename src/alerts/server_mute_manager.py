@@ -27,31 +27,32 @@ class ServerMuteManager(BaseMuteManager):
 
     def mute_server(self, duration: timedelta) -> datetime:
         """Mute all server alerts (system, array, UPS)."""
-        expiry = datetime.now() + duration
+        expiry = self._now() + duration.total_seconds()
         for cat in self.CATEGORIES:
-            self._mutes[cat] = expiry
+            self._set_expiry(cat, expiry)
         self._save()
-        logger.info(f"Muted all server alerts until {expiry}")
-        return expiry
+        expiry_dt = datetime.fromtimestamp(expiry)
+        logger.info("Muted all server alerts until %s", expiry_dt)
+        return expiry_dt
 
     def mute_array(self, duration: timedelta) -> datetime:
         """Mute just array/disk alerts."""
         expiry = self._add_mute("array", duration)
-        logger.info(f"Muted array alerts until {expiry}")
+        logger.info("Muted array alerts until %s", expiry)
         return expiry
 
     def mute_ups(self, duration: timedelta) -> datetime:
         """Mute just UPS alerts."""
         expiry = self._add_mute("ups", duration)
-        logger.info(f"Muted UPS alerts until {expiry}")
+        logger.info("Muted UPS alerts until %s", expiry)
         return expiry
 
     def unmute_server(self) -> bool:
         """Unmute all server alerts."""
+        self._clean_expired()
         removed = False
         for cat in self.CATEGORIES:
-            if cat in self._mutes:
-                del self._mutes[cat]
+            if self._mutes.pop(cat, None) is not None:
                 removed = True
         if removed:
             self._save()
@@ -3,6 +3,10 @@
 import json
 import logging
 import re
+import string
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from src.utils.api_errors import handle_anthropic_error
@@ -13,6 +17,44 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json_object(text: str) -> dict | None:
+    """Extract the first JSON object from a model response.
+
+    The response may wrap the object in markdown or surrounding prose, and
+    the object itself may contain nested objects or braces inside strings.
+
+    Returns:
+        The decoded object, or None if the text contains no JSON object.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            result, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+            continue
+        if isinstance(result, dict):
+            return result
+        start = text.find("{", start + 1)
+    return None
+
+
+@lru_cache(maxsize=512)
+def _compile_or_none(pattern: str) -> re.Pattern | None:
+    """Compile a regex, returning None if it is invalid.
+
+    Cached so repeated patterns are validated once, independent of re's own
+    internal cache.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
 ANALYSIS_PROMPT = """Analyze this error from a Docker container log and create a pattern to match it and similar variations.
 
 Container: {container}
@@ -35,12 +77,36 @@ Guidelines:
 - The explanation should be concise (under 50 words)"""
 
 
+def _split_template(template: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Split a format template into literal chunks and field names.
+
+    Returns:
+        (literals, fields) where literals has one more entry than fields and
+        the filled prompt is literals interleaved with the field values.
+    """
+    literals: list[str] = []
+    fields: list[str] = []
+    chunk = ""
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        chunk += literal
+        if field_name is not None:
+            literals.append(chunk)
+            fields.append(field_name)
+            chunk = ""
+    literals.append(chunk)
+    return tuple(literals), tuple(fields)
+
+
+# ANALYSIS_PROMPT split once at import so building a prompt is a single join
+_PROMPT_LITERALS, _PROMPT_FIELDS = _split_template(ANALYSIS_PROMPT)
+
+
 class PatternAnalyzer:
     """Uses Claude Haiku to analyze errors and generate ignore patterns."""
 
     def __init__(
         self,
-        anthropic_client: "anthropic.Anthropic | None",
+        anthropic_client: "anthropic.AsyncAnthropic | None",
         model: str = "claude-haiku-4-5-20251001",
         max_tokens: int = 500,
         context_lines: int = 30,
@@ -54,7 +120,7 @@ class PatternAnalyzer:
         self,
         container: str,
         error_message: str,
-        recent_logs: list[str],
+        recent_logs: Sequence[str],
     ) -> dict | None:
         """Analyze an error and generate an ignore pattern.
 
@@ -65,21 +131,24 @@ class PatternAnalyzer:
             logger.warning("No Anthropic client available for pattern analysis")
             return None
 
-        logs_text = "\n".join(recent_logs[-self._context_lines:]) if recent_logs else "(no recent logs)"
+        if recent_logs:
+            # Join only the last context_lines entries without copying the
+            # sequence; also works for deques, which cannot be sliced
+            skip = len(recent_logs) - self._context_lines
+            logs_text = "\n".join(islice(recent_logs, skip, None) if skip > 0 else recent_logs)
+        else:
+            logs_text = "(no recent logs)"
 
         # Sanitize user-controlled inputs to prevent prompt injection
         safe_container = sanitize_container_name(container)
         safe_error = sanitize_logs(error_message, max_length=2000)
         safe_logs = sanitize_logs(logs_text)
 
-        prompt = ANALYSIS_PROMPT.format(
-            container=safe_container,
-            error_message=safe_error,
-            recent_logs=safe_logs,
-        )
+        p0, p1, p2, p3 = _PROMPT_LITERALS
+        prompt = "".join((p0, safe_container, p1, safe_error, p2, safe_logs, p3))
 
         try:
-            response = self._client.messages.create(
+            response = await self._client.messages.create(
                 model=self._model,
                 max_tokens=self._max_tokens,
                 messages=[{"role": "user", "content": prompt}],
@@ -88,25 +157,20 @@ class PatternAnalyzer:
             text = response.content[0].text
 
             # Extract JSON from response (may be wrapped in markdown)
-            json_match = re.search(r"\{[^{}]*\}", text, re.DOTALL)
-            if not json_match:
-                logger.error(f"No JSON found in Haiku response: {text}")
+            result = _extract_json_object(text)
+            if result is None:
+                logger.error("No JSON found in Haiku response: %s", text)
                 return None
 
-            result = json.loads(json_match.group())
-
             # Validate required fields
             if not all(k in result for k in ("pattern", "match_type", "explanation")):
-                logger.error(f"Missing fields in Haiku response: {result}")
+                logger.error("Missing fields in Haiku response: %s", result)
                 return None
 
             # Validate regex if specified
-            if result["match_type"] == "regex":
-                try:
-                    re.compile(result["pattern"])
-                except re.error as e:
-                    logger.warning(f"Invalid regex from Haiku, falling back to substring: {e}")
-                    result["match_type"] = "substring"
+            if result["match_type"] == "regex" and _compile_or_none(result["pattern"]) is None:
+                logger.warning("Invalid regex from Haiku, falling back to substring: %s", result["pattern"])
+                result["match_type"] = "substring"
 
             return result
 
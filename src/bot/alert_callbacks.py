@@ -1,20 +1,91 @@
 """Callback handlers for alert action buttons."""
 
+import asyncio
 import logging
 from datetime import timedelta
-from typing import Callable, Awaitable, Any
+from typing import Callable, Awaitable, Any, TypeVar
 
 from aiogram import Bot
 from aiogram.types import CallbackQuery
 from aiogram.exceptions import TelegramBadRequest
+from aiogram.utils.text_decorations import markdown_decoration
 import docker
 
 from src.state import ContainerStateManager
+from src.utils.coalesce import SharedTasks
+from src.utils.formatting import decode_log_tail, escape_markdown_v2_code
 from src.services.container_control import ContainerController
-from src.services.diagnostic import DiagnosticService
+from src.services.diagnostic import DiagnosticContext, DiagnosticService
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Button actions currently running, keyed by (action, container, ...)
+_inflight = SharedTasks()
+
+
+async def _acknowledge_during(work: Awaitable[T], *acks: Awaitable[Any]) -> T:
+    """Await work while acknowledgements are sent concurrently.
+
+    The Telegram round trips that acknowledge a button press overlap with
+    the Docker or AI call instead of delaying its start. A failed
+    acknowledgement (e.g. "query is too old") is logged and does not
+    discard the result of work that has already run.
+    """
+    ack_results, result = await asyncio.gather(
+        asyncio.gather(*acks, return_exceptions=True),
+        work,
+    )
+    for ack_result in ack_results:
+        if isinstance(ack_result, BaseException):
+            logger.warning("Failed to acknowledge button press: %s", ack_result)
+    return result
+
+
+def _format_mute_minutes(minutes: int) -> str:
+    """Format a mute duration in minutes for display."""
+    if minutes >= 1440:
+        return f"{minutes // 1440} day(s)"
+    if minutes >= 60:
+        return f"{minutes // 60} hour(s)"
+    return f"{minutes} minute(s)"
+
+
+# Labels for the mute durations offered on alert buttons
+_MUTE_DURATION_LABELS = {minutes: _format_mute_minutes(minutes) for minutes in (60, 1440)}
+
+
+def _parse_callback_data(data: str, default_count: int | None = None) -> tuple[str, int | None] | None:
+    """Parse alert button callback data.
+
+    Data is "action:container" or, when default_count is given,
+    "action:container:count". The count is split off the right and the
+    action off the left, so container names containing colons survive.
+
+    Args:
+        data: Callback data from the button.
+        default_count: Count to use if the count is not a number; None if
+            the data has no count.
+
+    Returns:
+        Tuple of (container_name, count), or None if data is malformed.
+    """
+    count: int | None = None
+    if default_count is not None:
+        data, sep, count_text = data.rpartition(":")
+        if not sep:
+            return None
+        try:
+            count = int(count_text)
+        except ValueError:
+            count = default_count
+
+    _, sep, container_name = data.partition(":")
+    if not sep:
+        return None
+    return container_name, count
+
 
 def restart_callback(
     state: ContainerStateManager,
@@ -27,27 +98,25 @@ def restart_callback(
             return
 
         # Parse callback data: restart:container_name
-        # Use maxsplit=1 to handle container names with colons
-        parts = callback.data.split(":", 1)
-        if len(parts) < 2:
+        parsed = _parse_callback_data(callback.data)
+        if parsed is None:
             await callback.answer("Invalid callback data")
             return
+        container_name, _ = parsed
 
-        container_name = parts[1]
-
-        # Find container
-        matches = state.find_by_name(container_name)
-        if not matches:
+        # Alert buttons carry the canonical name, so an exact lookup is
+        # enough to reject buttons for containers that no longer exist
+        if state.get(container_name) is None:
             await callback.answer(f"Container '{container_name}' not found")
             return
 
-        actual_name = matches[0].name
-
-        # Acknowledge button press
-        await callback.answer(f"Restarting {actual_name}...")
+        actual_name = container_name
 
-        # Perform restart
-        message = await controller.restart(actual_name)
+        # Perform restart while acknowledging the button press
+        message = await _acknowledge_during(
+            _inflight.run(("restart", actual_name), lambda: controller.restart(actual_name)),
+            callback.answer(f"Restarting {actual_name}..."),
+        )
 
         # Send result message (message already contains emoji indicator)
         if callback.message:
@@ -64,60 +133,54 @@ def logs_callback(
 ) -> Callable[[CallbackQuery], Awaitable[None]]:
     """Factory for logs button callback handler."""
 
+    async def fetch_logs(container_name: str, lines: int) -> bytes:
+        # docker-py is blocking; run it off the event loop
+        docker_container = await asyncio.to_thread(docker_client.containers.get, container_name)
+        return await asyncio.to_thread(docker_container.logs, tail=lines, timestamps=False)
+
     async def handler(callback: CallbackQuery) -> None:
         if not callback.data:
             return
 
         # Parse callback data: logs:container_name:lines
-        # Split from the right to handle container names with colons
-        # Format: logs:container_name:50 -> ["logs", "container_name", "50"]
-        parts = callback.data.rsplit(":", 1)  # Split off the lines count
-        if len(parts) < 2:
-            await callback.answer("Invalid callback data")
-            return
-
-        try:
-            lines = int(parts[1])
-        except ValueError:
-            lines = 50
-
-        # Now split the prefix to get container name
-        prefix_parts = parts[0].split(":", 1)  # Split off "logs"
-        if len(prefix_parts) < 2:
+        parsed = _parse_callback_data(callback.data, default_count=50)
+        if parsed is None:
             await callback.answer("Invalid callback data")
             return
-
-        container_name = prefix_parts[1]
+        container_name, lines = parsed
 
         # Cap at reasonable limit
         lines = min(lines, max_lines)
 
-        # Find container
-        matches = state.find_by_name(container_name)
-        if not matches:
+        # Alert buttons carry the canonical name, so an exact lookup is
+        # enough to reject buttons for containers that no longer exist
+        if state.get(container_name) is None:
             await callback.answer(f"Container '{container_name}' not found")
             return
 
-        actual_name = matches[0].name
-
-        # Acknowledge button press
-        await callback.answer(f"Fetching logs for {actual_name}...")
+        actual_name = container_name
 
         try:
-            docker_container = docker_client.containers.get(actual_name)
-            log_bytes = docker_container.logs(tail=lines, timestamps=False)
-            log_text = log_bytes.decode("utf-8", errors="replace")
-
+            # Fetch logs while acknowledging the button press
+            log_bytes = await _acknowledge_during(
+                _inflight.run(("logs", actual_name, lines), lambda: fetch_logs(actual_name, lines)),
+                callback.answer(f"Fetching logs for {actual_name}..."),
+            )
             # Truncate if too long for Telegram
-            if len(log_text) > max_chars:
-                log_text = log_text[-max_chars:]
+            log_text, truncated = decode_log_tail(log_bytes, max_chars)
+            if truncated:
                 log_text = "...(truncated)\n" + log_text
 
-            response = f"*Logs: {actual_name}* (last {lines} lines)\n\n```\n{log_text}\n```"
+            # MarkdownV2 with escaped content, so arbitrary log output does
+            # not fail to parse and force a plain text retry
+            response = (
+                f"*Logs: {markdown_decoration.quote(actual_name)}* \\(last {lines} lines\\)\n\n"
+                f"```\n{escape_markdown_v2_code(log_text)}\n```"
+            )
 
             if callback.message:
                 try:
-                    await callback.message.answer(response, parse_mode="Markdown")
+                    await callback.message.answer(response, parse_mode="MarkdownV2")
                 except TelegramBadRequest:
                     # Fall back to plain text
                     plain_response = f"Logs: {actual_name} (last {lines} lines)\n\n{log_text}"
@@ -140,6 +203,15 @@ def diagnose_callback(
 ) -> Callable[[CallbackQuery], Awaitable[None]]:
     """Factory for diagnose button callback handler."""
 
+    async def diagnose(container_name: str) -> tuple[DiagnosticContext | None, str | None]:
+        # Gather context (blocking Docker calls, so run in a thread)
+        context = await asyncio.to_thread(diagnostic_service.gather_context, container_name, lines=50)
+        if not context:
+            return None, None
+
+        # Analyze with Claude
+        return context, await diagnostic_service.analyze(context)
+
     async def handler(callback: CallbackQuery) -> None:
         if not callback.data:
             return
@@ -149,38 +221,34 @@ def diagnose_callback(
             return
 
         # Parse callback data: diagnose:container_name
-        # Use maxsplit=1 to handle container names with colons
-        parts = callback.data.split(":", 1)
-        if len(parts) < 2:
+        parsed = _parse_callback_data(callback.data)
+        if parsed is None:
             await callback.answer("Invalid callback data")
             return
+        container_name, _ = parsed
 
-        container_name = parts[1]
-
-        # Find container
-        matches = state.find_by_name(container_name)
-        if not matches:
+        # Alert buttons carry the canonical name, so an exact lookup is
+        # enough to reject buttons for containers that no longer exist
+        if state.get(container_name) is None:
             await callback.answer(f"Container '{container_name}' not found")
             return
 
-        actual_name = matches[0].name
-
-        # Acknowledge button press
-        await callback.answer(f"Analyzing {actual_name}...")
+        actual_name = container_name
 
+        # Diagnose while acknowledging the button press
+        acks = [callback.answer(f"Analyzing {actual_name}...")]
         if callback.message:
-            await callback.message.answer(f"Analyzing {actual_name}...")
+            acks.append(callback.message.answer(f"Analyzing {actual_name}..."))
 
-        # Gather context
-        context = diagnostic_service.gather_context(actual_name, lines=50)
+        context, analysis = await _acknowledge_during(
+            _inflight.run(("diagnose", actual_name), lambda: diagnose(actual_name)),
+            *acks,
+        )
         if not context:
             if callback.message:
                 await callback.message.answer(f"Could not get container info for '{actual_name}'")
             return
 
-        # Analyze with Claude
-        analysis = await diagnostic_service.analyze(context)
-
         # Store context for follow-up
         user_id = callback.from_user.id if callback.from_user else 0
         context.brief_summary = analysis
@@ -217,43 +285,25 @@ def mute_callback(
             return
 
         # Parse callback data: mute:container_name:minutes
-        # Split from the right to handle container names with colons
-        parts = callback.data.rsplit(":", 1)  # Split off the minutes count
-        if len(parts) < 2:
+        parsed = _parse_callback_data(callback.data, default_count=60)
+        if parsed is None:
             await callback.answer("Invalid callback data")
             return
+        container_name, minutes = parsed
 
-        try:
-            minutes = int(parts[1])
-        except ValueError:
-            minutes = 60
-
-        # Now split the prefix to get container name
-        prefix_parts = parts[0].split(":", 1)  # Split off "mute"
-        if len(prefix_parts) < 2:
-            await callback.answer("Invalid callback data")
-            return
-
-        container_name = prefix_parts[1]
-
-        # Find container
-        matches = state.find_by_name(container_name)
-        if not matches:
+        # Alert buttons carry the canonical name, so an exact lookup is
+        # enough to reject buttons for containers that no longer exist
+        if state.get(container_name) is None:
             await callback.answer(f"Container '{container_name}' not found")
             return
 
-        actual_name = matches[0].name
+        actual_name = container_name
 
         # Mute the container
         mute_manager.add_mute(actual_name, timedelta(minutes=minutes))
 
         # Format duration for display
-        if minutes >= 1440:
-            duration_str = f"{minutes // 1440} day(s)"
-        elif minutes >= 60:
-            duration_str = f"{minutes // 60} hour(s)"
-        else:
-            duration_str = f"{minutes} minute(s)"
+        duration_str = _MUTE_DURATION_LABELS.get(minutes) or _format_mute_minutes(minutes)
 
         await callback.answer(f"Muted {actual_name} for {duration_str}")
 
@@ -1,10 +1,13 @@
+import asyncio
 from typing import Callable, Awaitable
 
 from aiogram.types import Message
+from aiogram.utils.text_decorations import markdown_decoration
 import docker
 
 from src.models import ContainerInfo
 from src.state import ContainerStateManager
+from src.utils.formatting import decode_log_tail, escape_markdown_v2_code
 
 
 HELP_TEXT = """📋 *Commands*
@@ -32,6 +35,13 @@ _Partial names work: /status rad → radarr_
 _Reply /diagnose to crash alerts for AI analysis_
 _Click "Ignore Similar" on alerts for smart patterns_"""
 
+HEALTH_EMOJI = {
+    "healthy": "✅",
+    "unhealthy": "⚠️",
+    "starting": "🔄",
+    None: "➖",
+}
+
 
 def help_command(state: ContainerStateManager) -> Callable[[Message], Awaitable[None]]:
     """Factory for /help command handler."""
@@ -42,18 +52,24 @@ def help_command(state: ContainerStateManager) -> Callable[[Message], Awaitable[
 
 def format_status_summary(state: ContainerStateManager) -> str:
     """Format container status summary."""
-    summary = state.get_summary()
-    all_containers = state.get_all()
-
-    stopped = [c.name for c in all_containers if c.status != "running"]
-    unhealthy = [c.name for c in all_containers if c.health == "unhealthy"]
+    # Single pass over one snapshot so the counts and lists agree
+    running = 0
+    stopped: list[str] = []
+    unhealthy: list[str] = []
+    for c in state.get_all():
+        if c.status == "running":
+            running += 1
+        else:
+            stopped.append(c.name)
+        if c.health == "unhealthy":
+            unhealthy.append(c.name)
 
     lines = [
         "📊 *Container Status*",
         "",
-        f"✅ Running: {summary['running']}",
-        f"🔴 Stopped: {summary['stopped']}",
-        f"⚠️ Unhealthy: {summary['unhealthy']}",
+        f"✅ Running: {running}",
+        f"🔴 Stopped: {len(stopped)}",
+        f"⚠️ Unhealthy: {len(unhealthy)}",
     ]
 
     if stopped:
@@ -75,24 +91,20 @@ def format_status_summary(state: ContainerStateManager) -> str:
 
 def format_container_details(container: ContainerInfo) -> str:
     """Format detailed container info."""
-    health_emoji = {
-        "healthy": "✅",
-        "unhealthy": "⚠️",
-        "starting": "🔄",
-        None: "➖",
-    }
     status_emoji = "🟢" if container.status == "running" else "🔴"
 
     lines = [
         f"*{container.name}*",
         "",
         f"Status: {status_emoji} {container.status}",
-        f"Health: {health_emoji.get(container.health, '➖')} {container.health or 'no healthcheck'}",
+        f"Health: {HEALTH_EMOJI.get(container.health, '➖')} {container.health or 'no healthcheck'}",
         f"Image: `{container.image}`",
     ]
 
     if container.started_at:
-        lines.append(f"Started: {container.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        # isoformat skips strftime's locale handling; drop any UTC offset
+        started = container.started_at.isoformat(sep=" ", timespec="seconds")[:19]
+        lines.append(f"Started: {started}")
 
     return "\n".join(lines)
 
@@ -133,7 +145,8 @@ def logs_command(
     """Factory for /logs command handler."""
     async def handler(message: Message) -> None:
         text = message.text or ""
-        parts = text.strip().split()
+        # Only the leading tokens are used; don't split the rest of the text
+        parts = text.split(None, 3)
 
         if len(parts) < 2:
             await message.answer("Usage: /logs <container> [lines]\n\nExample: /logs radarr 50")
@@ -165,17 +178,21 @@ def logs_command(
         container = matches[0]
 
         try:
-            docker_container = docker_client.containers.get(container.name)
-            log_bytes = docker_container.logs(tail=lines, timestamps=False)
-            log_text = log_bytes.decode("utf-8", errors="replace")
-
+            # docker-py is blocking; run it off the event loop
+            docker_container = await asyncio.to_thread(docker_client.containers.get, container.name)
+            log_bytes = await asyncio.to_thread(docker_container.logs, tail=lines, timestamps=False)
             # Truncate if too long for Telegram
-            if len(log_text) > max_chars:
-                log_text = log_text[-max_chars:]
+            log_text, truncated = decode_log_tail(log_bytes, max_chars)
+            if truncated:
                 log_text = "...(truncated)\n" + log_text
 
-            response = f"📋 *Logs: {container.name}* (last {lines} lines)\n\n```\n{log_text}\n```"
-            await message.answer(response, parse_mode="Markdown")
+            # MarkdownV2 with escaped content, so arbitrary log output does
+            # not fail to parse
+            response = (
+                f"📋 *Logs: {markdown_decoration.quote(container.name)}* \\(last {lines} lines\\)\n\n"
+                f"```\n{escape_markdown_v2_code(log_text)}\n```"
+            )
+            await message.answer(response, parse_mode="MarkdownV2")
 
         except docker.errors.NotFound:
             await message.answer(f"❌ Container '{container.name}' not found in Docker")
@@ -1,13 +1,14 @@
+import heapq
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PendingConfirmation:
     """A pending confirmation waiting for user response."""
     action: str  # "restart", "stop", "start", "pull"
     container_name: str
-    expires_at: datetime
+    expires_at: float  # time.monotonic() deadline
 
 
 class ConfirmationManager:
@@ -16,26 +17,32 @@ class ConfirmationManager:
     def __init__(self, timeout_seconds: int = 60):
         self.timeout_seconds = timeout_seconds
         self._pending: dict[int, PendingConfirmation] = {}
+        # Min-heap of (expires_at, user_id); entries made stale by replacement
+        # or removal are skipped lazily when popped
+        self._expiry_heap: list[tuple[float, int]] = []
 
     def request(self, user_id: int, action: str, container_name: str) -> None:
         """Store a pending confirmation for a user.
 
         Replaces any existing pending confirmation for this user.
         """
-        expires_at = datetime.now() + timedelta(seconds=self.timeout_seconds)
+        self._evict_expired()
+        expires_at = time.monotonic() + self.timeout_seconds
         self._pending[user_id] = PendingConfirmation(
             action=action,
             container_name=container_name,
             expires_at=expires_at,
         )
+        heapq.heappush(self._expiry_heap, (expires_at, user_id))
 
     def get_pending(self, user_id: int) -> PendingConfirmation | None:
         """Get pending confirmation for user if not expired."""
+        self._evict_expired()
         pending = self._pending.get(user_id)
         if pending is None:
             return None
 
-        if datetime.now() > pending.expires_at:
+        if time.monotonic() > pending.expires_at:
             del self._pending[user_id]
             return None
 
@@ -50,7 +57,22 @@ class ConfirmationManager:
 
     def cancel(self, user_id: int) -> bool:
         """Cancel pending confirmation for user."""
+        self._evict_expired()
         if user_id in self._pending:
             del self._pending[user_id]
             return True
         return False
+
+    def _evict_expired(self) -> None:
+        """Remove expired confirmations for all users.
+
+        Only entries at the top of the expiry heap are examined, so cost is
+        proportional to the number of expired confirmations.
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            expires_at, user_id = heapq.heappop(heap)
+            pending = self._pending.get(user_id)
+            if pending is not None and pending.expires_at == expires_at:
+                del self._pending[user_id]
@@ -32,13 +32,16 @@ def _find_container(state: ContainerStateManager, query: str) -> tuple[str | Non
     return matches[0].name, None
 
 
-def _format_confirmation_message(action: str, container_name: str, status: str, timeout_seconds: int = 60) -> str:
-    """Format the confirmation request message."""
+def _confirmation_template(action: str, timeout_seconds: int) -> str:
+    """Build the confirmation request template for an action.
+
+    The result has {container_name} and {status} placeholders.
+    """
     emoji = ACTION_EMOJI.get(action, "⚠️")
 
-    return f"""{emoji} *{action.capitalize()} {container_name}?*
+    return f"""{emoji} *{action.capitalize()} {{container_name}}?*
 
-Current status: {status}
+Current status: {{status}}
 
 Reply 'yes' to confirm (expires in {timeout_seconds}s)"""
 
@@ -50,12 +53,17 @@ def _control_command(
     confirmation: ConfirmationManager,
 ) -> Callable[[Message], Awaitable[None]]:
     """Generic factory for container control command handlers."""
+    # Per-action text is fixed, so build it once rather than per message
+    usage = f"Usage: /{action} <container>\n\nExample: /{action} radarr"
+    confirm_template = _confirmation_template(action, confirmation.timeout_seconds)
+
     async def handler(message: Message) -> None:
         text = message.text or ""
-        parts = text.strip().split()
+        # Only the leading tokens are used; don't split the rest of the text
+        parts = text.split(None, 2)
 
         if len(parts) < 2:
-            await message.answer(f"Usage: /{action} <container>\n\nExample: /{action} radarr")
+            await message.answer(usage)
             return
 
         query = parts[1]
@@ -76,7 +84,7 @@ def _control_command(
         confirmation.request(user_id, action=action, container_name=container_name)
 
         await message.answer(
-            _format_confirmation_message(action, container_name, status),
+            confirm_template.format(container_name=container_name, status=status),
             parse_mode="Markdown",
         )
 
@@ -124,6 +132,14 @@ def create_confirm_handler(
     confirmation: ConfirmationManager,
 ) -> Callable[[Message], Awaitable[None]]:
     """Factory for confirmation handler (responds to 'yes')."""
+    # Bound once so dispatch is a single lookup per confirmation
+    actions = {
+        "restart": controller.restart,
+        "stop": controller.stop,
+        "start": controller.start,
+        "pull": controller.pull_and_recreate,
+    }
+
     async def handler(message: Message) -> None:
         user_id = message.from_user.id
         pending = confirmation.confirm(user_id)
@@ -137,14 +153,9 @@ def create_confirm_handler(
 
         await message.answer(f"🔄 Executing {action} on {container_name}...")
 
-        if action == "restart":
-            result = await controller.restart(container_name)
-        elif action == "stop":
-            result = await controller.stop(container_name)
-        elif action == "start":
-            result = await controller.start(container_name)
-        elif action == "pull":
-            result = await controller.pull_and_recreate(container_name)
+        run_action = actions.get(action)
+        if run_action is not None:
+            result = await run_action(container_name)
         else:
             result = f"❌ Unknown action: {action}"
 
@@ -1,30 +1,28 @@
 """Diagnose command handler for AI-powered container analysis."""
 
+import asyncio
 import logging
-import re
 from typing import Callable, Awaitable
 
 from aiogram.types import Message
 from aiogram.exceptions import TelegramBadRequest
 
+from src.alerts.manager import ALERT_KIND_CRASH, parse_alert_header
 from src.state import ContainerStateManager
 from src.services.diagnostic import DiagnosticService
 
 logger = logging.getLogger(__name__)
 
-# Pattern to extract container name from crash alert
-CRASH_ALERT_PATTERN = re.compile(r"\*CONTAINER CRASHED:\*\s+(\w+)")
-
 
 def _extract_container_from_reply(reply_message: Message) -> str | None:
     """Extract container name from a crash alert message."""
     if not reply_message or not reply_message.text:
         return None
 
-    match = CRASH_ALERT_PATTERN.search(reply_message.text)
-    if match:
-        return match.group(1)
-    return None
+    header = parse_alert_header(reply_message.text)
+    if header is None or header[0] != ALERT_KIND_CRASH:
+        return None
+    return header[1]
 
 
 def diagnose_command(
@@ -36,7 +34,8 @@ def diagnose_command(
 
     async def handler(message: Message) -> None:
         text = message.text or ""
-        parts = text.strip().split()
+        # Only the leading tokens are used; don't split the rest of the text
+        parts = text.split(None, 3)
         user_id = message.from_user.id
 
         container_name = None
@@ -85,8 +84,8 @@ def diagnose_command(
 
         await message.answer(f"Analyzing {actual_name}...")
 
-        # Gather context
-        context = diagnostic_service.gather_context(actual_name, lines=lines)
+        # Gather context (blocking Docker calls, so run in a thread)
+        context = await asyncio.to_thread(diagnostic_service.gather_context, actual_name, lines=lines)
         if not context:
             await message.answer(f"Could not get container info for '{actual_name}'")
             return
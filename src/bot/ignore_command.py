@@ -1,9 +1,15 @@
-import re
+import asyncio
+import heapq
+import io
 import logging
+import time
 from typing import Callable, Awaitable, TYPE_CHECKING
 
 from aiogram.types import Message, CallbackQuery
 
+from src.alerts.manager import ALERT_KIND_ERRORS, parse_alert_header
+from src.utils.formatting import escape_markdown, markdown_code, markdown_italic
+
 if TYPE_CHECKING:
     from src.alerts.recent_errors import RecentErrorsBuffer
     from src.alerts.ignore_manager import IgnoreManager
@@ -11,34 +17,92 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Pattern to extract container name from error alert
-ALERT_PATTERN = re.compile(r"ERRORS IN[:\s]+(\w+)", re.IGNORECASE)
+# How long an /ignore list waits for the user's selection
+SELECTION_TIMEOUT_SECONDS = 300
+
+# Most users with a selection pending at once; the oldest is dropped
+MAX_PENDING_SELECTIONS = 1024
+
+# Cap on pattern analyses run at once for a multi-error selection
+MAX_CONCURRENT_ANALYSES = 8
+
+# Deletes every character allowed in a selection like "1, 3"; anything
+# left over means the text is not a list of numbers
+_SELECTION_CHARS = str.maketrans("", "", "0123456789, \t")
+
+
+def _parse_selection(text: str) -> list[int] | None:
+    """Parse comma-separated error numbers, e.g. "1" or "1, 3".
+
+    Returns:
+        The numbers as entered, or None if text is not a number list.
+    """
+    if text.translate(_SELECTION_CHARS):
+        return None
+    try:
+        return list(map(int, text.split(",")))
+    except ValueError:
+        # Empty items, e.g. "1,,3", or spaces inside a number
+        return None
 
 
 def extract_container_from_alert(text: str) -> str | None:
     """Extract container name from error alert message."""
-    match = ALERT_PATTERN.search(text)
-    return match.group(1) if match else None
+    header = parse_alert_header(text)
+    if header is None or header[0] != ALERT_KIND_ERRORS:
+        return None
+    return header[1]
 
 
 class IgnoreSelectionState:
-    """Shared state for ignore selections across handlers."""
+    """Shared state for ignore selections across handlers.
+
+    Selections expire after timeout_seconds, so users who run /ignore and
+    never reply don't leave their error lists behind. At most
+    MAX_PENDING_SELECTIONS are kept; beyond that the least recently set
+    selection is dropped.
+    """
 
-    def __init__(self):
+    def __init__(self, timeout_seconds: float = SELECTION_TIMEOUT_SECONDS):
+        self.timeout_seconds = timeout_seconds
         self.pending_selections: dict[int, tuple[str, list[str]]] = {}
+        # time.monotonic() deadline per user, plus a min-heap of
+        # (expires_at, user_id); stale heap entries are skipped when popped
+        self._expires_at: dict[int, float] = {}
+        self._expiry_heap: list[tuple[float, int]] = []
 
     def has_pending(self, user_id: int) -> bool:
+        self._evict_expired()
         return user_id in self.pending_selections
 
     def get_pending(self, user_id: int) -> tuple[str, list[str]] | None:
+        self._evict_expired()
         return self.pending_selections.get(user_id)
 
     def set_pending(self, user_id: int, container: str, errors: list[str]) -> None:
+        self._evict_expired()
+        expires_at = time.monotonic() + self.timeout_seconds
+        # Re-insert so dict order runs from least to most recently set
+        self.pending_selections.pop(user_id, None)
         self.pending_selections[user_id] = (container, errors)
+        self._expires_at[user_id] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, user_id))
+        if len(self.pending_selections) > MAX_PENDING_SELECTIONS:
+            self.clear_pending(next(iter(self.pending_selections)))
 
     def clear_pending(self, user_id: int) -> None:
         if user_id in self.pending_selections:
             del self.pending_selections[user_id]
+            del self._expires_at[user_id]
+
+    def _evict_expired(self) -> None:
+        """Remove expired selections for all users."""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, user_id = heapq.heappop(heap)
+            if self._expires_at.get(user_id) == expires_at:
+                self.clear_pending(user_id)
 
 
 def ignore_command(
@@ -72,19 +136,19 @@ def ignore_command(
             return
 
         # Build numbered list
-        lines = [f"🔇 *Recent errors in {container}* (last 15 min):\n"]
+        buf = io.StringIO()
+        buf.write(f"🔇 *Recent errors in {container}* (last 15 min):\n\n")
         for i, error in enumerate(recent_errors, 1):
-            # Truncate long errors
+            # Truncate long errors; escape so Markdown in logs can't break parsing
             display = error[:80] + "..." if len(error) > 80 else error
-            lines.append(f"`{i}.` {display}")
+            buf.write(f"`{i}.` {escape_markdown(display)}\n")
 
-        lines.append("")
-        lines.append('_Reply with numbers to ignore (e.g., "1,3" or "all")_')
+        buf.write('\n_Reply with numbers to ignore (e.g., "1,3" or "all")_')
 
         # Store pending selection
         selection_state.set_pending(user_id, container, recent_errors)
 
-        await message.answer("\n".join(lines), parse_mode="Markdown")
+        await message.answer(buf.getvalue(), parse_mode="Markdown")
 
     return handler
 
@@ -99,70 +163,77 @@ def ignore_selection_handler(
     async def handler(message: Message) -> None:
         user_id = message.from_user.id if message.from_user else 0
 
-        if not selection_state.has_pending(user_id):
-            # No pending selection - don't respond
-            return
-
         pending = selection_state.get_pending(user_id)
         if not pending:
+            # No pending selection - don't respond
             return
 
         container, errors = pending
-        text = (message.text or "").strip().lower()
-
-        # Parse the selection first, before clearing pending state
-        if text == "all":
-            indices = list(range(len(errors)))
-        else:
-            # Parse comma-separated numbers
-            try:
-                indices = [int(x.strip()) - 1 for x in text.split(",")]
-                # Validate indices
-                if any(i < 0 or i >= len(errors) for i in indices):
-                    await message.answer("Invalid selection. Numbers must be from the list.")
-                    return
-            except ValueError:
-                await message.answer("Invalid input. Use numbers like '1,3' or 'all'.")
+        text = (message.text or "").strip()
+
+        # Parse the selection first, before clearing pending state. Numbers
+        # are the usual reply, so check them before case-folding for "all"
+        numbers = _parse_selection(text)
+        if numbers is not None:
+            # Validate numbers against the list
+            if min(numbers) < 1 or max(numbers) > len(errors):
+                await message.answer("Invalid selection. Numbers must be from the list.")
                 return
+            # Repeated numbers ("1,1,3") would analyze the same error twice
+            indices = [n - 1 for n in dict.fromkeys(numbers)]
+        elif text.lower() == "all":
+            indices = range(len(errors))
+        else:
+            await message.answer("Invalid input. Use numbers like '1,3' or 'all'.")
+            return
 
         # Only clear pending selection after successful parse
         selection_state.clear_pending(user_id)
 
-        # Process each selected error
-        added = []
-        for i in indices:
-            error = errors[i]
+        selected = [errors[i] for i in indices]
 
-            # Try to analyze with Haiku
-            if pattern_analyzer is not None:
-                result = await pattern_analyzer.analyze_error(
-                    container=container,
-                    error_message=error,
-                    recent_logs=[],  # Could pass more context here
-                )
+        # Try to analyze with Haiku, all selected errors at once
+        if pattern_analyzer is not None:
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
 
-                if result:
-                    if ignore_manager.add_ignore_pattern(
+            async def analyze(error: str) -> dict | None:
+                async with semaphore:
+                    return await pattern_analyzer.analyze_error(
                         container=container,
-                        pattern=result["pattern"],
-                        match_type=result["match_type"],
-                        explanation=result["explanation"],
-                    ):
-                        added.append((result["pattern"], result["explanation"]))
-                    continue
+                        error_message=error,
+                        recent_logs=[],  # Could pass more context here
+                    )
+
+            results = await asyncio.gather(*(analyze(error) for error in selected))
+        else:
+            results = [None] * len(selected)
+
+        # Process each selected error, in the order chosen
+        added = []
+        for error, result in zip(selected, results):
+            if result:
+                if ignore_manager.add_ignore_pattern(
+                    container=container,
+                    pattern=result["pattern"],
+                    match_type=result["match_type"],
+                    explanation=result["explanation"],
+                ):
+                    added.append((result["pattern"], result["explanation"]))
+                continue
 
             # Fallback to simple substring
             if ignore_manager.add_ignore(container, error):
                 added.append((error, ""))
 
         if added:
-            lines = [f"✅ *Ignored for {container}:*\n"]
+            buf = io.StringIO()
+            buf.write(f"✅ *Ignored for {container}:*\n")
             for pattern, explanation in added:
                 display = pattern[:60] + "..." if len(pattern) > 60 else pattern
-                lines.append(f"  • `{display}`")
+                buf.write(f"\n  • {markdown_code(display)}")
                 if explanation:
-                    lines.append(f"    _{explanation}_")
-            await message.answer("\n".join(lines), parse_mode="Markdown")
+                    buf.write(f"\n    {markdown_italic(explanation)}")
+            await message.answer(buf.getvalue(), parse_mode="Markdown")
         else:
             await message.answer("Those errors are already ignored.")
 
@@ -175,37 +246,35 @@ def ignores_command(
     """Factory for /ignores command handler."""
 
     async def handler(message: Message) -> None:
-        # Collect all ignores across containers
-        all_containers: set[str] = set()
-
-        # Get containers from config ignores
-        all_containers.update(ignore_manager._config_ignores.keys())
-
-        # Get containers from runtime ignores
-        all_containers.update(ignore_manager._runtime_ignores.keys())
+        # Containers with config or runtime ignores
+        all_containers = ignore_manager.get_containers()
 
         if not all_containers:
             await message.answer("🔇 No ignored errors configured.\n\nUse /ignore to add some.")
             return
 
-        lines = ["🔇 Ignored Errors\n"]
+        # Written straight into one buffer; the list can be long
+        buf = io.StringIO()
+        buf.write("🔇 Ignored Errors\n\n")
 
-        for container in sorted(all_containers):
+        for container in all_containers:
             ignores = ignore_manager.get_all_ignores(container)
             if ignores:
-                lines.append(f"{container} ({len(ignores)}):")
+                buf.write(f"{container} ({len(ignores)}):\n")
                 for pattern, source, explanation in ignores:
-                    display = pattern[:50] + "..." if len(pattern) > 50 else pattern
-                    source_tag = " (config)" if source == "config" else ""
-                    lines.append(f"  * {display}{source_tag}")
+                    buf.write("  * ")
+                    buf.write(pattern[:50] + "..." if len(pattern) > 50 else pattern)
+                    if source == "config":
+                        buf.write(" (config)")
+                    buf.write("\n")
                     if explanation:
-                        lines.append(f"    ({explanation})")
-                lines.append("")
+                        buf.write(f"    ({explanation})\n")
+                buf.write("\n")
 
-        lines.append("Use /ignore to add more")
+        buf.write("Use /ignore to add more")
 
         # Don't use Markdown - patterns may contain special characters
-        await message.answer("\n".join(lines))
+        await message.answer(buf.getvalue())
 
     return handler
 
@@ -227,22 +296,16 @@ def ignore_similar_callback(
         _, container, error_preview = parts
 
         # Get full error from recent buffer
-        recent = recent_errors_buffer.get_recent(container)
-        full_error = None
-        for error in recent:
-            if error.startswith(error_preview):
-                full_error = error
-                break
-
-        if not full_error:
-            full_error = error_preview
+        full_error = recent_errors_buffer.find_by_prefix(container, error_preview) or error_preview
 
-        # Analyze with Haiku if available
+        # Analyze with Haiku if available. Analysis takes seconds, so
+        # acknowledge the press first rather than leave the button spinning
         if pattern_analyzer:
+            await callback.answer("Analyzing error...")
             result = await pattern_analyzer.analyze_error(
                 container=container,
                 error_message=full_error,
-                recent_logs=recent,
+                recent_logs=recent_errors_buffer.get_recent(container),
             )
 
             if result:
@@ -253,20 +316,21 @@ def ignore_similar_callback(
                     explanation=result["explanation"],
                 )
                 await callback.message.answer(
-                    f"✅ Ignoring: {result['explanation']}\n"
-                    f"Pattern: `{result['pattern']}`",
+                    f"✅ Ignoring: {escape_markdown(result['explanation'])}\n"
+                    f"Pattern: {markdown_code(result['pattern'])}",
                     parse_mode="Markdown",
                 )
-                await callback.answer("Pattern added")
                 return
 
         # Fallback to substring
         ignore_manager.add_ignore(container, full_error)
         display = full_error[:60] + "..." if len(full_error) > 60 else full_error
         await callback.message.answer(
-            f"✅ Ignoring: `{display}`",
+            f"✅ Ignoring: {markdown_code(display)}",
             parse_mode="Markdown",
         )
-        await callback.answer("Added to ignore list")
+        # A press can only be answered once; with an analyzer it already was
+        if not pattern_analyzer:
+            await callback.answer("Added to ignore list")
 
     return handler
@@ -1,5 +1,6 @@
 """Manage command for ignores and mutes."""
 
+import io
 import logging
 from typing import Callable, Awaitable, TYPE_CHECKING
 
@@ -8,6 +9,8 @@ from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKe
 from src.bot.commands import format_status_summary
 from src.bot.resources_command import format_resources_summary
 from src.bot.unraid_commands import format_server_brief, format_server_detailed, format_disks
+from src.utils.coalesce import SharedTasks
+from src.utils.formatting import escape_markdown, format_clock_time, markdown_code, markdown_italic
 
 if TYPE_CHECKING:
     from src.alerts.ignore_manager import IgnoreManager
@@ -20,6 +23,42 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# How long a summary fetched for one button press is reused for others
+SUMMARY_REUSE_SECONDS = 2.0
+
+# The /manage menu never changes, so it is built once and reused
+MANAGE_KEYBOARD = InlineKeyboardMarkup(
+    inline_keyboard=[
+        [
+            InlineKeyboardButton(text="📊 Status", callback_data="manage:status"),
+            InlineKeyboardButton(text="📈 Resources", callback_data="manage:resources"),
+        ],
+        [
+            InlineKeyboardButton(text="🖥️ Server", callback_data="manage:server"),
+            InlineKeyboardButton(text="💾 Disks", callback_data="manage:disks"),
+        ],
+        [
+            InlineKeyboardButton(text="📝 Manage Ignores", callback_data="manage:ignores"),
+            InlineKeyboardButton(text="🔕 Manage Mutes", callback_data="manage:mutes"),
+        ],
+    ]
+)
+
+# Most users with a removal selection pending at once, per kind
+MAX_PENDING_SELECTIONS = 1024
+
+
+def _set_bounded(pending: dict, user_id: int, value: object) -> None:
+    """Store a user's pending selection, evicting the oldest beyond the cap.
+
+    Re-inserting keeps dict order running from least to most recently set,
+    so the first key is the one to drop when over MAX_PENDING_SELECTIONS.
+    """
+    pending.pop(user_id, None)
+    pending[user_id] = value
+    if len(pending) > MAX_PENDING_SELECTIONS:
+        del pending[next(iter(pending))]
+
 
 class ManageSelectionState:
     """Shared state for manage selections across handlers."""
@@ -33,7 +72,7 @@ class ManageSelectionState:
     def set_pending_ignore(
         self, user_id: int, container: str, ignores: list[tuple[int, str, str | None]]
     ) -> None:
-        self.pending_ignore_removal[user_id] = (container, ignores)
+        _set_bounded(self.pending_ignore_removal, user_id, (container, ignores))
 
     def get_pending_ignore(self, user_id: int) -> tuple[str, list[tuple[int, str, str | None]]] | None:
         return self.pending_ignore_removal.get(user_id)
@@ -42,7 +81,7 @@ class ManageSelectionState:
         self.pending_ignore_removal.pop(user_id, None)
 
     def set_pending_mute(self, user_id: int, mutes: list[tuple[str, str]]) -> None:
-        self.pending_mute_removal[user_id] = mutes
+        _set_bounded(self.pending_mute_removal, user_id, mutes)
 
     def get_pending_mute(self, user_id: int) -> list[tuple[str, str]] | None:
         return self.pending_mute_removal.get(user_id)
@@ -67,26 +106,9 @@ def manage_command(
             if brief:
                 server_info = brief + "\n\n"
 
-        keyboard = InlineKeyboardMarkup(
-            inline_keyboard=[
-                [
-                    InlineKeyboardButton(text="📊 Status", callback_data="manage:status"),
-                    InlineKeyboardButton(text="📈 Resources", callback_data="manage:resources"),
-                ],
-                [
-                    InlineKeyboardButton(text="🖥️ Server", callback_data="manage:server"),
-                    InlineKeyboardButton(text="💾 Disks", callback_data="manage:disks"),
-                ],
-                [
-                    InlineKeyboardButton(text="📝 Manage Ignores", callback_data="manage:ignores"),
-                    InlineKeyboardButton(text="🔕 Manage Mutes", callback_data="manage:mutes"),
-                ],
-            ]
-        )
-
         await message.answer(
             f"{server_info}What would you like to do?",
-            reply_markup=keyboard,
+            reply_markup=MANAGE_KEYBOARD,
             parse_mode="Markdown",
         )
 
@@ -112,6 +134,9 @@ def manage_resources_callback(
     resource_monitor: "ResourceMonitor | None",
 ) -> Callable[[CallbackQuery], Awaitable[None]]:
     """Factory for resources button callback."""
+    if resource_monitor:
+        # Collecting stats queries every container; share it across presses
+        summaries = SharedTasks(ttl=SUMMARY_REUSE_SECONDS)
 
     async def handler(callback: CallbackQuery) -> None:
         await callback.answer()
@@ -121,7 +146,9 @@ def manage_resources_callback(
                 await callback.message.answer("Resource monitoring not enabled.")
             return
 
-        summary = await format_resources_summary(resource_monitor)
+        summary = await summaries.run(
+            "resources", lambda: format_resources_summary(resource_monitor)
+        )
         if summary:
             if callback.message:
                 await callback.message.answer(summary, parse_mode="Markdown")
@@ -136,6 +163,8 @@ def manage_server_callback(
     system_monitor: "UnraidSystemMonitor | None",
 ) -> Callable[[CallbackQuery], Awaitable[None]]:
     """Factory for server button callback (shows detailed info)."""
+    if system_monitor:
+        responses = SharedTasks(ttl=SUMMARY_REUSE_SECONDS)
 
     async def handler(callback: CallbackQuery) -> None:
         await callback.answer()
@@ -145,7 +174,7 @@ def manage_server_callback(
                 await callback.message.answer("🖥️ Unraid monitoring not configured.")
             return
 
-        response = await format_server_detailed(system_monitor)
+        response = await responses.run("server", lambda: format_server_detailed(system_monitor))
         if response:
             if callback.message:
                 await callback.message.answer(response, parse_mode="Markdown")
@@ -160,6 +189,8 @@ def manage_disks_callback(
     system_monitor: "UnraidSystemMonitor | None",
 ) -> Callable[[CallbackQuery], Awaitable[None]]:
     """Factory for disks button callback."""
+    if system_monitor:
+        responses = SharedTasks(ttl=SUMMARY_REUSE_SECONDS)
 
     async def handler(callback: CallbackQuery) -> None:
         await callback.answer()
@@ -169,7 +200,7 @@ def manage_disks_callback(
                 await callback.message.answer("💾 Unraid monitoring not configured.")
             return
 
-        response = await format_disks(system_monitor)
+        response = await responses.run("disks", lambda: format_disks(system_monitor))
         if response:
             if callback.message:
                 await callback.message.answer(response, parse_mode="Markdown")
@@ -186,9 +217,9 @@ def manage_ignores_callback(
     """Factory for manage ignores button callback."""
 
     async def handler(callback: CallbackQuery) -> None:
-        containers = ignore_manager.get_containers_with_runtime_ignores()
+        counts = ignore_manager.get_runtime_ignore_counts()
 
-        if not containers:
+        if not counts:
             await callback.answer("No runtime ignores to manage")
             if callback.message:
                 await callback.message.answer(
@@ -198,15 +229,15 @@ def manage_ignores_callback(
             return
 
         # Build buttons for each container
-        buttons = []
-        for container in sorted(containers):
-            count = len(ignore_manager.get_runtime_ignores(container))
-            buttons.append([
+        buttons = [
+            [
                 InlineKeyboardButton(
-                    text=f"{container} ({count})",
+                    text=f"{container} ({counts[container]})",
                     callback_data=f"manage:ignores:{container}",
                 )
-            ])
+            ]
+            for container in sorted(counts)
+        ]
 
         keyboard = InlineKeyboardMarkup(inline_keyboard=buttons)
 
@@ -245,22 +276,22 @@ def manage_ignores_container_callback(
             return
 
         # Build numbered list
-        lines = [f"📝 *Ignores for {container}:*\n"]
+        buf = io.StringIO()
+        buf.write(f"📝 *Ignores for {container}:*\n\n")
         for i, (index, pattern, explanation) in enumerate(ignores, 1):
             display = pattern[:60] + "..." if len(pattern) > 60 else pattern
-            lines.append(f"`{i}.` {display}")
+            buf.write(f"`{i}.` {escape_markdown(display)}\n")
             if explanation:
-                lines.append(f"    _{explanation}_")
+                buf.write(f"    {markdown_italic(explanation)}\n")
 
-        lines.append("")
-        lines.append("_Type a number to remove, or 'cancel' to abort._")
+        buf.write("\n_Type a number to remove, or 'cancel' to abort._")
 
         # Store pending selection
         selection_state.set_pending_ignore(user_id, container, ignores)
 
         await callback.answer()
         if callback.message:
-            await callback.message.answer("\n".join(lines), parse_mode="Markdown")
+            await callback.message.answer(buf.getvalue(), parse_mode="Markdown")
 
     return handler
 
@@ -281,21 +312,21 @@ def manage_mutes_callback(
 
         # Container mutes
         for container, expiry in mute_manager.get_active_mutes():
-            time_str = expiry.strftime("%H:%M")
+            time_str = format_clock_time(expiry)
             mutes.append(("container", container, f"{container} - until {time_str}"))
 
         # Server mutes
         if server_mute_manager:
             for category, expiry in server_mute_manager.get_active_mutes():
                 if category == "server":
-                    time_str = expiry.strftime("%H:%M")
+                    time_str = format_clock_time(expiry)
                     mutes.append(("server", "server", f"Server alerts - until {time_str}"))
 
         # Array mutes
         if array_mute_manager:
             expiry = array_mute_manager.get_mute_expiry()
             if expiry:
-                time_str = expiry.strftime("%H:%M")
+                time_str = format_clock_time(expiry)
                 mutes.append(("array", "array", f"Array alerts - until {time_str}"))
 
         if not mutes:
@@ -305,19 +336,19 @@ def manage_mutes_callback(
             return
 
         # Build numbered list
-        lines = ["🔕 *Active Mutes:*\n"]
+        buf = io.StringIO()
+        buf.write("🔕 *Active Mutes:*\n\n")
         for i, (mute_type, key, display) in enumerate(mutes, 1):
-            lines.append(f"`{i}.` {display}")
+            buf.write(f"`{i}.` {escape_markdown(display)}\n")
 
-        lines.append("")
-        lines.append("_Type a number to unmute, or 'cancel' to abort._")
+        buf.write("\n_Type a number to unmute, or 'cancel' to abort._")
 
         # Store pending selection (just type and key, not display)
         selection_state.set_pending_mute(user_id, [(t, k) for t, k, _ in mutes])
 
         await callback.answer()
         if callback.message:
-            await callback.message.answer("\n".join(lines), parse_mode="Markdown")
+            await callback.message.answer(buf.getvalue(), parse_mode="Markdown")
 
     return handler
 
@@ -333,6 +364,12 @@ def manage_selection_handler(
 
     async def handler(message: Message) -> None:
         user_id = message.from_user.id if message.from_user else 0
+        pending_ignore = selection_state.get_pending_ignore(user_id)
+        pending_mute = selection_state.get_pending_mute(user_id)
+        if not pending_ignore and not pending_mute:
+            # No pending selection - don't respond
+            return
+
         text = (message.text or "").strip().lower()
 
         # Check for cancel
@@ -343,7 +380,6 @@ def manage_selection_handler(
             return
 
         # Check for pending ignore removal
-        pending_ignore = selection_state.get_pending_ignore(user_id)
         if pending_ignore:
             container, ignores = pending_ignore
 
@@ -362,13 +398,12 @@ def manage_selection_handler(
 
             if ignore_manager.remove_runtime_ignore(container, actual_index):
                 display = pattern[:50] + "..." if len(pattern) > 50 else pattern
-                await message.answer(f"✅ Removed ignore from {container}:\n`{display}`", parse_mode="Markdown")
+                await message.answer(f"✅ Removed ignore from {container}:\n{markdown_code(display)}", parse_mode="Markdown")
             else:
                 await message.answer("Failed to remove ignore.")
             return
 
         # Check for pending mute removal
-        pending_mute = selection_state.get_pending_mute(user_id)
         if pending_mute:
             try:
                 selection = int(text)
@@ -389,12 +424,12 @@ def manage_selection_handler(
                 else:
                     await message.answer("Failed to unmute.")
             elif mute_type == "server" and server_mute_manager:
-                if server_mute_manager.remove_mute("server"):
+                if server_mute_manager.unmute_server():
                     await message.answer("🔔 *Server alerts unmuted*", parse_mode="Markdown")
                 else:
                     await message.answer("Failed to unmute server alerts.")
             elif mute_type == "array" and array_mute_manager:
-                if array_mute_manager.unmute():
+                if array_mute_manager.unmute_array():
                     await message.answer("🔔 *Array alerts unmuted*", parse_mode="Markdown")
                 else:
                     await message.answer("Failed to unmute array alerts.")
@@ -6,6 +6,7 @@ from datetime import timedelta
 from aiogram.types import Message
 
 from src.alerts.mute_manager import parse_duration
+from src.utils.formatting import format_clock_time
 
 if TYPE_CHECKING:
     from src.alerts.mute_manager import MuteManager
@@ -130,7 +131,7 @@ def mute_command(
         expiry = mute_manager.add_mute(container, duration)
 
         # Format expiry time
-        time_str = expiry.strftime("%H:%M")
+        time_str = format_clock_time(expiry)
         await message.answer(
             f"🔇 *Muted {container}* until {time_str}\n\n"
             f"All alerts suppressed for {format_duration(duration)}.\n"
@@ -192,7 +193,7 @@ def mutes_command(
         if container_mutes:
             lines.append("\nContainer mutes:")
             for container, expiry in sorted(container_mutes, key=lambda x: x[1]):
-                time_str = expiry.strftime("%H:%M")
+                time_str = format_clock_time(expiry)
                 lines.append(f"  {container}: until {time_str}")
 
         # Server mutes section
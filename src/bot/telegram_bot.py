@@ -91,14 +91,13 @@ class IgnoreSelectionFilter(Filter):
         self.selection_state = selection_state
 
     async def __call__(self, message: Message) -> bool:
-        if not message.text:
+        user_id = message.from_user.id if message.from_user else 0
+        # Only match if user has a pending selection; checked first since
+        # almost every message comes from a user without one
+        if not self.selection_state.has_pending(user_id):
             return False
         # Don't intercept commands - let them be processed normally
-        if message.text.startswith("/"):
-            return False
-        user_id = message.from_user.id if message.from_user else 0
-        # Only match if user has a pending selection
-        return self.selection_state.has_pending(user_id)
+        return bool(message.text) and not message.text.startswith("/")
 
 
 class ManageSelectionFilter(Filter):
@@ -108,14 +107,13 @@ class ManageSelectionFilter(Filter):
         self.selection_state = selection_state
 
     async def __call__(self, message: Message) -> bool:
-        if not message.text:
+        user_id = message.from_user.id if message.from_user else 0
+        # Only match if user has a pending selection; checked first since
+        # almost every message comes from a user without one
+        if not self.selection_state.has_pending(user_id):
             return False
         # Don't intercept commands - let them be processed normally
-        if message.text.startswith("/"):
-            return False
-        user_id = message.from_user.id if message.from_user else 0
-        # Only match if user has a pending selection
-        return self.selection_state.has_pending(user_id)
+        return bool(message.text) and not message.text.startswith("/")
 
 
 def create_details_handler(
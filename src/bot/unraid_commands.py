@@ -7,6 +7,7 @@ from typing import Callable, Awaitable, TYPE_CHECKING
 from aiogram.types import Message
 
 from src.alerts.mute_manager import parse_duration
+from src.utils.formatting import format_clock_time
 
 if TYPE_CHECKING:
     from src.unraid.monitors.system_monitor import UnraidSystemMonitor
@@ -234,7 +235,7 @@ def mute_server_command(
             return
 
         expiry = mute_manager.mute_server(duration)
-        time_str = expiry.strftime("%H:%M")
+        time_str = format_clock_time(expiry)
 
         await message.answer(
             f"🔇 *Muted all server alerts* until {time_str}\n\n"
@@ -294,7 +295,7 @@ def mute_array_command(
             return
 
         expiry = mute_manager.mute_array(duration)
-        time_str = expiry.strftime("%H:%M")
+        time_str = format_clock_time(expiry)
 
         await message.answer(
             f"🔇 *Muted array alerts* until {time_str}\n\n"
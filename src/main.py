@@ -87,8 +87,10 @@ async def main() -> None:
     pattern_analyzer = None
     if config.anthropic_api_key:
         anthropic_client = anthropic.Anthropic(api_key=config.anthropic_api_key)
+        # Pattern analysis runs inside bot handlers, so it uses the async
+        # client to avoid blocking the event loop during the API call
         pattern_analyzer = PatternAnalyzer(
-            anthropic_client,
+            anthropic.AsyncAnthropic(api_key=config.anthropic_api_key),
             model=ai_config.pattern_analyzer_model,
             max_tokens=ai_config.pattern_analyzer_max_tokens,
             context_lines=ai_config.pattern_analyzer_context_lines,
@@ -196,7 +198,7 @@ async def main() -> None:
         """Handle log errors with rate limiting."""
         # Check if muted
         if mute_manager.is_muted(container_name):
-            logger.debug(f"Suppressed log error alert for muted container: {container_name}")
+            logger.debug("Suppressed log error alert for muted container: %s", container_name)
             return
 
         if rate_limiter.should_alert(container_name):
@@ -373,6 +375,13 @@ async def main() -> None:
         await dp.start_polling(bot)
     finally:
         logger.info("Shutting down...")
+        # Persist any debounced mute/ignore changes
+        ignore_manager.flush()
+        mute_manager.flush()
+        if server_mute_manager is not None:
+            server_mute_manager.flush()
+        if array_mute_manager is not None:
+            array_mute_manager.flush()
         monitor.stop()
         log_watcher.stop()
         if resource_monitor is not None:
@@ -1,11 +1,13 @@
 import asyncio
 import logging
+import sys
 from datetime import datetime
 from typing import Any, Callable, Awaitable, TYPE_CHECKING
 
 import docker
 from docker.models.containers import Container
 
+from src.alerts.manager import send_many
 from src.models import ContainerInfo
 from src.state import ContainerStateManager
 
@@ -40,7 +42,9 @@ def parse_container(container: Container) -> ContainerInfo:
             pass
 
     return ContainerInfo(
-        name=container.name,
+        # Interned: the same few names are re-parsed on every event and used
+        # as dict keys throughout, so share one string object per name
+        name=sys.intern(container.name),
         status=container.status,
         health=health,
         image=image,
@@ -142,15 +146,16 @@ class DockerEventMonitor:
                     logger.error(f"Reconnection failed: {reconnect_error}")
 
     def _reconnect(self) -> None:
-        """Attempt to reconnect to Docker daemon."""
-        # Close existing client if any
-        if self._client:
-            try:
-                self._client.close()
-            except Exception:
-                pass
+        """Attempt to reconnect to Docker daemon.
 
-        self._client = docker.DockerClient(base_url=self._docker_socket_path)
+        The existing client is reused rather than replaced, since the bot
+        handlers and other monitors share it; docker-py reopens pooled
+        connections on demand, so a ping confirms the daemon is back.
+        """
+        if not self._client:
+            self._client = docker.DockerClient(base_url=self._docker_socket_path)
+
+        self._client.ping()
         self.load_initial_state()
         logger.info("Docker reconnection successful")
 
@@ -166,7 +171,16 @@ class DockerEventMonitor:
                 except asyncio.TimeoutError:
                     continue
 
-                await self._handle_crash_event(event)
+                # Crashes often come in bursts (e.g. a shared dependency
+                # going down); handle everything already queued together
+                events = [event]
+                while not self._pending_alerts.empty():
+                    events.append(self._pending_alerts.get_nowait())
+
+                if len(events) == 1:
+                    await self._handle_crash_event(event)
+                else:
+                    await send_many(self._handle_crash_event(queued) for queued in events)
             except Exception as e:
                 logger.error(f"Error processing alert: {e}")
 
@@ -262,24 +276,24 @@ class DockerEventMonitor:
 
         # Skip if exit code is 0 (normal stop)
         if exit_code == 0:
-            logger.debug(f"Container {container_name} exited normally (code 0)")
+            logger.debug("Container %s exited normally (code 0)", container_name)
             return
 
         # Skip if container is in ignored list
         if container_name in self.ignored_containers:
-            logger.debug(f"Ignoring crash alert for ignored container: {container_name}")
+            logger.debug("Ignoring crash alert for ignored container: %s", container_name)
             return
 
         # Check if muted
         if self.mute_manager and self.mute_manager.is_muted(container_name):
-            logger.debug(f"Suppressed crash alert for muted container: {container_name}")
+            logger.debug("Suppressed crash alert for muted container: %s", container_name)
             return
 
         # Check rate limiter if available
         if self.rate_limiter:
             if not self.rate_limiter.should_alert(container_name):
                 self.rate_limiter.record_suppressed(container_name)
-                logger.debug(f"Rate-limited crash alert for {container_name}")
+                logger.debug("Rate-limited crash alert for %s", container_name)
                 return
             self.rate_limiter.record_alert(container_name)
 
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 import docker
 
+from src.alerts.manager import send_many
 from src.utils.formatting import format_bytes
 
 if TYPE_CHECKING:
@@ -284,7 +285,7 @@ class ResourceMonitor:
         """
         # Check if muted
         if self._mute_manager and self._mute_manager.is_muted(stats.name):
-            logger.debug(f"Suppressed resource alert for muted container: {stats.name}")
+            logger.debug("Suppressed resource alert for muted container: %s", stats.name)
             return
 
         # Use rate limiter key that includes metric to allow separate cpu/memory alerts
@@ -292,7 +293,7 @@ class ResourceMonitor:
 
         if not self._rate_limiter.should_alert(rate_key):
             self._rate_limiter.record_suppressed(rate_key)
-            logger.debug(f"Rate-limited {violation.metric} alert for {stats.name}")
+            logger.debug("Rate-limited %s alert for %s", violation.metric, stats.name)
             return
 
         self._rate_limiter.record_alert(rate_key)
@@ -340,10 +341,15 @@ class ResourceMonitor:
         """Execute one polling cycle."""
         stats_list = await self.get_all_stats()
 
+        alerts = []
         for stats in stats_list:
             self._check_thresholds(stats)
 
-            # Check for sustained violations and send alerts
+            # Check for sustained violations and queue alerts
             sustained = self._get_sustained_violations(stats.name)
             for violation in sustained:
-                await self._send_alert(stats, violation)
+                alerts.append(self._send_alert(stats, violation))
+
+        # Send all alerts from this cycle concurrently
+        if alerts:
+            await send_many(alerts)
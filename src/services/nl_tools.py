@@ -6,6 +6,7 @@ import docker
 
 from src.state import ContainerStateManager
 from src.models import ContainerInfo
+from src.utils.formatting import decode_log_tail
 from src.utils.sanitize import sanitize_logs
 
 if TYPE_CHECKING:
@@ -332,11 +333,10 @@ class NLToolExecutor:
         try:
             container = self._docker.containers.get(resolved.name)
             log_bytes = container.logs(tail=lines, timestamps=False)
-            logs = log_bytes.decode("utf-8", errors="replace")
+            logs, truncated = decode_log_tail(log_bytes, self._log_max_chars)
             if not logs.strip():
                 return f"No recent logs for {resolved.name}"
-            if len(logs) > self._log_max_chars:
-                logs = logs[-self._log_max_chars:]
+            if truncated:
                 logs = f"... (truncated)\n{logs}"
             # Sanitize logs to prevent prompt injection via tool results
             safe_logs = sanitize_logs(logs, max_length=self._log_max_chars)
@@ -1,7 +1,11 @@
 import threading
+from collections import OrderedDict
 
 from src.models import ContainerInfo
 
+# Number of substring queries whose matching names are remembered
+MATCH_CACHE_SIZE = 128
+
 
 class ContainerStateManager:
     """Thread-safe container state manager.
@@ -12,10 +16,22 @@ class ContainerStateManager:
 
     def __init__(self):
         self._containers: dict[str, ContainerInfo] = {}
+        # Lowercased names, cached so lookups don't lower every name per
+        # call; _by_lower maps to the first container with that spelling
+        self._lower_names: dict[str, str] = {}
+        self._by_lower: dict[str, str] = {}
+        # Substring query -> matching names, LRU ordered. Only the set of
+        # names affects matches, so this is cleared when a container is added
+        self._match_cache: OrderedDict[str, tuple[str, ...]] = OrderedDict()
         self._lock = threading.Lock()
 
     def update(self, info: ContainerInfo) -> None:
         with self._lock:
+            if info.name not in self._containers:
+                lower = info.name.lower()
+                self._lower_names[info.name] = lower
+                self._by_lower.setdefault(lower, info.name)
+                self._match_cache.clear()
             self._containers[info.name] = info
 
     def get(self, name: str) -> ContainerInfo | None:
@@ -31,15 +47,24 @@ class ContainerStateManager:
 
         with self._lock:
             # Check for exact match first
-            for c in self._containers.values():
-                if c.name.lower() == partial_lower:
-                    return [c]
-
-            # Fall back to substring match
-            return [
-                c for c in self._containers.values()
-                if partial_lower in c.name.lower()
-            ]
+            exact = self._by_lower.get(partial_lower)
+            if exact is not None:
+                return [self._containers[exact]]
+
+            # Fall back to substring match, reusing names from a previous
+            # identical query; infos are looked up fresh so status is current
+            names = self._match_cache.get(partial_lower)
+            if names is None:
+                names = tuple(
+                    name for name, lower in self._lower_names.items()
+                    if partial_lower in lower
+                )
+                self._match_cache[partial_lower] = names
+                if len(self._match_cache) > MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+            else:
+                self._match_cache.move_to_end(partial_lower)
+            return [self._containers[name] for name in names]
 
     def get_summary(self) -> dict[str, int]:
         running = 0
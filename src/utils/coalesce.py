@@ -0,0 +1,51 @@
+"""Helpers for sharing one run of an async action between callers."""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SharedTasks:
+    """Run an async action once for concurrent callers with the same key.
+
+    Callers arriving while an action is in flight await its result instead
+    of starting it again. With a ttl, a successful result is also reused for
+    ttl seconds after the action started; failed actions are never reused.
+    The shared task is shielded so one caller being cancelled does not
+    cancel it for others.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        """Initialize SharedTasks.
+
+        Args:
+            ttl: Seconds a successful result is reused after its action
+                started. Zero shares only while the action is running.
+        """
+        self._ttl = ttl
+        # key -> (task, monotonic start time)
+        self._tasks: dict[Hashable, tuple[asyncio.Future, float]] = {}
+
+    async def run(self, key: Hashable, action: Callable[[], Awaitable[T]]) -> T:
+        """Await the shared run of action for key, starting it if needed."""
+        now = time.monotonic()
+        entry = self._tasks.get(key)
+        if entry is not None and entry[0].done() and now - entry[1] > self._ttl:
+            entry = None
+        if entry is None:
+            task = asyncio.ensure_future(action())
+            self._tasks[key] = (task, now)
+            task.add_done_callback(lambda done: self._discard(key, done))
+        else:
+            task = entry[0]
+        return await asyncio.shield(task)
+
+    def _discard(self, key: Hashable, task: asyncio.Future) -> None:
+        """Drop a finished task unless its result should be reused."""
+        entry = self._tasks.get(key)
+        if entry is None or entry[0] is not task:
+            return
+        if self._ttl <= 0 or task.cancelled() or task.exception() is not None:
+            del self._tasks[key]
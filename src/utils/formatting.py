@@ -1,5 +1,12 @@
 """Shared formatting utility functions."""
 
+from datetime import datetime
+
+
+# Characters with meaning in Telegram's legacy Markdown, each mapped to its
+# backslash-escaped form
+_MARKDOWN_ESCAPE = str.maketrans({c: "\\" + c for c in "_*`["})
+
 
 def format_bytes(bytes_val: int) -> str:
     """Format bytes as human-readable string.
@@ -15,3 +22,102 @@ def format_bytes(bytes_val: int) -> str:
         return f"{gb:.1f}GB"
     mb = bytes_val / (1024**2)
     return f"{mb:.0f}MB"
+
+
+def format_clock_time(dt: datetime) -> str:
+    """Format a datetime as HH:MM, as shown for mute expiries.
+
+    Equivalent to dt.strftime("%H:%M") without parsing a format string.
+    """
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def decode_log_tail(log_bytes: bytes, max_chars: int) -> tuple[str, bool]:
+    """Decode the last max_chars characters of UTF-8 log output.
+
+    A UTF-8 character is at most 4 bytes, so only the last max_chars * 4
+    bytes can end up in the result; anything before that is dropped
+    without being decoded.
+
+    Args:
+        log_bytes: Raw log output from Docker.
+        max_chars: Maximum number of characters to keep.
+
+    Returns:
+        Tuple of (text, truncated) where truncated is True if output was cut.
+    """
+    truncated = False
+    max_bytes = max_chars * 4
+    if len(log_bytes) > max_bytes:
+        log_bytes = log_bytes[-max_bytes:]
+        truncated = True
+
+    text = log_bytes.decode("utf-8", errors="replace")
+    if len(text) > max_chars:
+        text = text[-max_chars:]
+        truncated = True
+    return text, truncated
+
+
+def escape_markdown_v2_code(text: str) -> str:
+    """Escape text for use inside a MarkdownV2 code block.
+
+    Inside pre and code entities only backslashes and backticks need to be
+    escaped, so arbitrary log output can be sent without a parse failure.
+
+    Args:
+        text: Raw text to place in the code block.
+
+    Returns:
+        Escaped text.
+    """
+    return text.replace("\\", "\\\\").replace("`", "\\`")
+
+
+def escape_markdown(text: str) -> str:
+    """Escape text for use outside entities in legacy Markdown messages.
+
+    Legacy Markdown has no escapes inside an entity; use markdown_code or
+    markdown_italic to format user-controlled text.
+
+    Args:
+        text: Raw text to place in the message.
+
+    Returns:
+        Escaped text.
+    """
+    return text.translate(_MARKDOWN_ESCAPE)
+
+
+def markdown_code(text: str) -> str:
+    """Format text as inline code in a legacy Markdown message.
+
+    A backtick cannot appear inside a legacy Markdown code span, so text
+    containing one is escaped and shown without code formatting instead.
+
+    Args:
+        text: Raw text to format.
+
+    Returns:
+        Markdown for the text.
+    """
+    if "`" in text:
+        return escape_markdown(text)
+    return f"`{text}`"
+
+
+def markdown_italic(text: str) -> str:
+    """Format text in italics in a legacy Markdown message.
+
+    An underscore would end the italic entity early, so text containing
+    one is escaped and shown without italics instead.
+
+    Args:
+        text: Raw text to format.
+
+    Returns:
+        Markdown for the text.
+    """
+    if "_" in text:
+        return escape_markdown(text)
+    return f"_{text}_"
@@ -0,0 +1,172 @@
+"""Helpers for persisting small state files to disk."""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait after a change before writing, so bursts coalesce
+DEFAULT_SAVE_DELAY = 1.0
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes.
+
+    Uses orjson when installed, falling back to the stdlib json module.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(payload: bytes) -> Any:
+    """Parse JSON bytes produced by dumps_json (or any valid JSON).
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write bytes to a file atomically.
+
+    The payload is written to a sibling temp file which then replaces the
+    target, so a crash mid-write never leaves a truncated state file.
+
+    Callers create the parent directory once up front; it is only
+    recreated here if it has since been removed.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        try:
+            tmp_path.write_bytes(payload)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class DebouncedSaver:
+    """Coalesce repeated save requests into a single deferred write.
+
+    When called from inside a running event loop, ``request()`` marks the
+    state dirty and schedules one flush after ``delay`` seconds; further
+    requests before then are absorbed. The scheduled flush encodes the state
+    on the event loop thread and performs the file write in a worker thread,
+    so handlers are never blocked on disk I/O. Outside an event loop
+    (startup, scripts, tests) the flush happens immediately. Pending changes
+    are also flushed at interpreter exit.
+
+    Writes whose payload matches the last one persisted are skipped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encode: Callable[[], bytes],
+        delay: float = DEFAULT_SAVE_DELAY,
+    ):
+        """Initialize DebouncedSaver.
+
+        Args:
+            path: File to write the state to.
+            encode: Callable returning the current state as bytes.
+            delay: Seconds to wait before flushing a pending change.
+        """
+        self._path = path
+        self._encode = encode
+        self._delay = delay
+        self._dirty = False
+        self._handle: asyncio.TimerHandle | None = None
+        self._last_payload: bytes | None = None
+        # Writes may finish out of order when run in threads; a sequence
+        # number ensures an older payload never overwrites a newer one.
+        self._seq = 0
+        self._written_seq = 0
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    @property
+    def pending(self) -> bool:
+        """Whether there are unsaved changes."""
+        return self._dirty
+
+    def mark_persisted(self, payload: bytes) -> None:
+        """Record bytes already on disk (e.g. just loaded) to skip rewriting them."""
+        self._last_payload = payload
+
+    def request(self) -> None:
+        """Mark state as changed and schedule a write."""
+        self._dirty = True
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+
+        if self._handle is None:
+            self._handle = loop.call_later(self._delay, self._flush_in_background)
+
+    def flush(self) -> None:
+        """Write pending changes now, cancelling any scheduled write."""
+        payload = self._take_payload()
+        if payload is not None:
+            self._write_payload(*payload)
+
+    def _flush_in_background(self) -> None:
+        """Timer callback: encode on the loop, write in a worker thread."""
+        payload = self._take_payload()
+        if payload is not None:
+            asyncio.get_running_loop().run_in_executor(None, self._write_payload, *payload)
+
+    def _take_payload(self) -> tuple[bytes, int] | None:
+        """Encode pending state, returning (payload, seq) if a write is needed."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if not self._dirty:
+            return None
+        self._dirty = False
+
+        payload = self._encode()
+        if payload == self._last_payload:
+            return None
+        self._last_payload = payload
+
+        self._seq += 1
+        return payload, self._seq
+
+    def _write_payload(self, payload: bytes, seq: int) -> None:
+        """Write an encoded payload unless a newer one has been written."""
+        with self._write_lock:
+            if seq <= self._written_seq:
+                return
+            try:
+                atomic_write_bytes(self._path, payload)
+            except OSError as e:
+                logger.error("Failed to save %s: %s", self._path, e)
+                self._last_payload = None
+                return
+            self._written_seq = seq
@@ -1,6 +1,20 @@
 """Input sanitization utilities for AI prompt injection prevention."""
 
 import re
+from functools import lru_cache
+
+# Common prompt injection patterns to neutralize
+# These patterns attempt to break out of data context and inject instructions
+INJECTION_PATTERNS = [
+    # Attempts to add new instructions
+    (re.compile(r"(?i)\b(ignore|disregard|forget)\s+(all\s+)?(previous|above|prior)\s+(instructions?|context|prompts?)"), "[FILTERED]"),
+    # Attempts to impersonate system prompts
+    (re.compile(r"(?i)^(system|assistant|human|user):\s*"), "data: "),
+    # Attempts to create new roles
+    (re.compile(r"(?i)\[?(system|assistant)\]?\s*:"), "[data]:"),
+    # XML/markdown injection attempts that might affect prompt parsing
+    (re.compile(r"<\s*/?(?:system|prompt|instruction|context)[^>]*>"), "[tag]"),
+]
 
 
 def sanitize_for_prompt(text: str, max_length: int = 10000) -> str:
@@ -23,30 +37,19 @@ def sanitize_for_prompt(text: str, max_length: int = 10000) -> str:
     if len(text) > max_length:
         text = text[:max_length] + "\n... (truncated)"
 
-    # Common prompt injection patterns to neutralize
-    # These patterns attempt to break out of data context and inject instructions
-    injection_patterns = [
-        # Attempts to add new instructions
-        (r"(?i)\b(ignore|disregard|forget)\s+(all\s+)?(previous|above|prior)\s+(instructions?|context|prompts?)", "[FILTERED]"),
-        # Attempts to impersonate system prompts
-        (r"(?i)^(system|assistant|human|user):\s*", "data: "),
-        # Attempts to create new roles
-        (r"(?i)\[?(system|assistant)\]?\s*:", "[data]:"),
-        # XML/markdown injection attempts that might affect prompt parsing
-        (r"<\s*/?(?:system|prompt|instruction|context)[^>]*>", "[tag]"),
-    ]
-
-    for pattern, replacement in injection_patterns:
-        text = re.sub(pattern, replacement, text)
+    for pattern, replacement in INJECTION_PATTERNS:
+        text = pattern.sub(replacement, text)
 
     return text
 
 
+@lru_cache(maxsize=256)
 def sanitize_container_name(name: str) -> str:
     """Sanitize a container name for use in prompts.
 
     Container names should be alphanumeric with dashes/underscores,
-    but malicious names could contain injection attempts.
+    but malicious names could contain injection attempts. Results are
+    cached since the same few names are sanitized repeatedly.
 
     Args:
         name: Container name to sanitize.
@@ -0,0 +1,142 @@
+"""Tests for alert action button callbacks."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+
+def _make_callback(data: str) -> MagicMock:
+    callback = MagicMock()
+    callback.data = data
+    callback.answer = AsyncMock()
+    callback.message = MagicMock()
+    callback.message.answer = AsyncMock()
+    return callback
+
+
+@pytest.fixture
+def state():
+    from src.state import ContainerStateManager
+    from src.models import ContainerInfo
+
+    manager = ContainerStateManager()
+    manager.update(ContainerInfo("radarr", "running", None, "img", None))
+    manager.update(ContainerInfo("radarr-4k", "running", None, "img", None))
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_mute_callback_uses_exact_container_name(state):
+    from src.bot.alert_callbacks import mute_callback
+
+    mute_manager = MagicMock()
+    handler = mute_callback(state, mute_manager)
+
+    await handler(_make_callback("mute:radarr:60"))
+
+    assert mute_manager.add_mute.call_args.args[0] == "radarr"
+
+
+@pytest.mark.asyncio
+async def test_mute_callback_rejects_unknown_container(state):
+    from src.bot.alert_callbacks import mute_callback
+
+    mute_manager = MagicMock()
+    handler = mute_callback(state, mute_manager)
+    callback = _make_callback("mute:radar:60")
+
+    await handler(callback)
+
+    mute_manager.add_mute.assert_not_called()
+    callback.answer.assert_called_once_with("Container 'radar' not found")
+
+
+@pytest.mark.asyncio
+async def test_restart_callback_restarts_named_container(state):
+    from src.bot.alert_callbacks import restart_callback
+
+    controller = MagicMock()
+    controller.restart = AsyncMock(return_value="✅ radarr-4k restarted")
+    handler = restart_callback(state, controller)
+
+    await handler(_make_callback("restart:radarr-4k"))
+
+    controller.restart.assert_called_once_with("radarr-4k")
+
+
+@pytest.mark.asyncio
+async def test_restart_callback_reports_result_when_ack_fails(state):
+    from aiogram.exceptions import TelegramBadRequest
+    from src.bot.alert_callbacks import restart_callback
+
+    controller = MagicMock()
+    controller.restart = AsyncMock(return_value="✅ radarr restarted")
+    handler = restart_callback(state, controller)
+    callback = _make_callback("restart:radarr")
+    callback.answer = AsyncMock(
+        side_effect=TelegramBadRequest(method=MagicMock(), message="query is too old")
+    )
+
+    await handler(callback)
+
+    controller.restart.assert_called_once_with("radarr")
+    callback.message.answer.assert_called_once_with("✅ radarr restarted")
+
+
+@pytest.mark.asyncio
+async def test_restart_callback_coalesces_concurrent_presses(state):
+    import asyncio
+    from src.bot.alert_callbacks import restart_callback
+
+    release = asyncio.Event()
+
+    async def slow_restart(name):
+        await release.wait()
+        return f"✅ {name} restarted"
+
+    controller = MagicMock()
+    controller.restart = AsyncMock(side_effect=slow_restart)
+    handler = restart_callback(state, controller)
+    first, second = _make_callback("restart:radarr"), _make_callback("restart:radarr")
+
+    tasks = [asyncio.create_task(handler(first)), asyncio.create_task(handler(second))]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*tasks)
+
+    controller.restart.assert_called_once_with("radarr")
+    first.message.answer.assert_called_once_with("✅ radarr restarted")
+    second.message.answer.assert_called_once_with("✅ radarr restarted")
+
+
+def test_parse_callback_data():
+    from src.bot.alert_callbacks import _parse_callback_data
+
+    assert _parse_callback_data("restart:radarr") == ("radarr", None)
+    assert _parse_callback_data("logs:radarr:50", default_count=20) == ("radarr", 50)
+    assert _parse_callback_data("logs:radarr:abc", default_count=20) == ("radarr", 20)
+    assert _parse_callback_data("mute:my:app:60", default_count=60) == ("my:app", 60)
+    assert _parse_callback_data("restart") is None
+    assert _parse_callback_data("logs", default_count=20) is None
+
+
+@pytest.mark.asyncio
+async def test_restart_callback_acknowledges_while_restarting(state):
+    import asyncio
+    from src.bot.alert_callbacks import restart_callback
+
+    acked = asyncio.Event()
+
+    async def restart(name):
+        # Only completes if the ack was sent concurrently
+        await asyncio.wait_for(acked.wait(), timeout=1)
+        return f"✅ {name} restarted"
+
+    controller = MagicMock()
+    controller.restart = AsyncMock(side_effect=restart)
+    callback = _make_callback("restart:radarr")
+    callback.answer = AsyncMock(side_effect=lambda *_: acked.set())
+
+    await restart_callback(state, controller)(callback)
+
+    callback.answer.assert_called_once_with("Restarting radarr...")
+    callback.message.answer.assert_called_once_with("✅ radarr restarted")
@@ -163,3 +163,59 @@ async def test_send_resource_alert_memory():
     assert "radarr" in text
     assert "Memory: 95.0%" in text
     assert "4 minutes" in text
+
+
+@pytest.mark.asyncio
+async def test_send_many_sends_concurrently_and_isolates_failures():
+    """Test send_many overlaps sends and continues past a failing alert."""
+    import asyncio
+    from src.alerts.manager import send_many
+
+    in_flight = 0
+    max_in_flight = 0
+    sent = []
+
+    async def alert(name, fail=False):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if fail:
+            raise RuntimeError("boom")
+        sent.append(name)
+
+    await send_many([alert("a"), alert("b", fail=True), alert("c")], max_concurrent=2)
+
+    assert sorted(sent) == ["a", "c"]
+    assert max_in_flight == 2
+
+
+def test_log_error_keyboard_callback_data_fits_limit():
+    """Test the ignore-similar callback data stays within 64 bytes."""
+    from src.alerts.manager import _log_error_keyboard
+
+    ascii_kb = _log_error_keyboard("plex", "x" * 300)
+    unicode_kb = _log_error_keyboard("plex", "é" * 300)
+
+    for keyboard in (ascii_kb, unicode_kb):
+        data = keyboard.inline_keyboard[0][0].callback_data
+        assert data.startswith("ignore_similar:plex:")
+        assert len(data.encode("utf-8")) <= 64
+    assert ascii_kb.inline_keyboard[0][0].callback_data == "ignore_similar:plex:" + "x" * 44
+
+
+def test_parse_alert_header_matches_only_the_start():
+    from src.alerts.manager import (
+        ALERT_KIND_CRASH,
+        ALERT_KIND_ERRORS,
+        parse_alert_header,
+    )
+
+    assert parse_alert_header("⚠️ ERRORS IN: plex\n\nFound 2 errors") == (ALERT_KIND_ERRORS, "plex")
+    assert parse_alert_header("🔴 *CONTAINER CRASHED:* overseerr\n\nExit code: 1") == (
+        ALERT_KIND_CRASH,
+        "overseerr",
+    )
+    # A header quoted further down the message is not an alert
+    assert parse_alert_header("Note\n⚠️ ERRORS IN: plex") is None
@@ -30,3 +30,21 @@ def test_array_mute_manager_persistence(tmp_path):
     # Create new instance - should load persisted state
     manager2 = ArrayMuteManager(json_path=str(json_file))
     assert manager2.is_array_muted()
+
+
+def test_array_mute_manager_migrates_legacy_format(tmp_path):
+    """Test the old {"mute_until": ...} file format is migrated."""
+    import json
+    from datetime import datetime, timezone
+    from src.alerts.array_mute_manager import ArrayMuteManager
+
+    json_file = tmp_path / "array_mutes.json"
+    expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+    json_file.write_text(json.dumps({"mute_until": expiry.isoformat()}))
+
+    manager = ArrayMuteManager(json_path=str(json_file))
+
+    assert manager.is_array_muted()
+    assert abs(manager.get_mute_expiry().timestamp() - expiry.timestamp()) < 1
+    saved = json.loads(json_file.read_text())
+    assert list(saved) == ["array"]
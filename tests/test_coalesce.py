@@ -0,0 +1,73 @@
+"""Tests for shared task helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_shared_tasks_runs_once_while_in_flight():
+    """Test concurrent callers with the same key share one run."""
+    from src.utils.coalesce import SharedTasks
+
+    tasks = SharedTasks()
+    release = asyncio.Event()
+    calls = 0
+
+    async def action():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    pending = [asyncio.create_task(tasks.run("key", action)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*pending) == [1, 1]
+    # Without a ttl, a finished run is not reused
+    assert await tasks.run("key", action) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_tasks_reuses_result_within_ttl(monkeypatch):
+    """Test calls close together share one result when a ttl is set."""
+    from src.utils.coalesce import SharedTasks
+
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return f"summary {calls}"
+
+    now = 100.0
+    monkeypatch.setattr("src.utils.coalesce.time.monotonic", lambda: now)
+    tasks = SharedTasks(ttl=2.0)
+
+    # Concurrent and repeated calls within the window share the fetch
+    assert await asyncio.gather(tasks.run("key", fetch), tasks.run("key", fetch)) == [
+        "summary 1",
+        "summary 1",
+    ]
+    now = 101.5
+    assert await tasks.run("key", fetch) == "summary 1"
+
+    now = 102.5
+    assert await tasks.run("key", fetch) == "summary 2"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_tasks_retries_after_failure():
+    """Test a failed run is not reused."""
+    from src.utils.coalesce import SharedTasks
+
+    fetch = AsyncMock(side_effect=[RuntimeError("unavailable"), "summary"])
+    tasks = SharedTasks(ttl=2.0)
+
+    with pytest.raises(RuntimeError):
+        await tasks.run("key", fetch)
+    assert await tasks.run("key", fetch) == "summary"
@@ -334,3 +334,43 @@ async def test_logs_command_multiple_matches():
     assert "radarr" in response
     assert "radarr-test" in response
     assert "multiple" in response.lower() or "matches" in response.lower()
+
+
+def test_format_container_details_started_at():
+    from datetime import datetime, timezone
+    from src.bot.commands import format_container_details
+    from src.models import ContainerInfo
+
+    info = ContainerInfo(
+        "radarr", "running", None, "img",
+        datetime(2025, 1, 25, 10, 0, 5, 123456, tzinfo=timezone.utc),
+    )
+
+    assert "Started: 2025-01-25 10:00:05\n" in format_container_details(info) + "\n"
+
+
+@pytest.mark.asyncio
+async def test_logs_command_escapes_log_output_for_markdown_v2():
+    """Test that log output with Markdown characters is escaped."""
+    from src.bot.commands import logs_command
+    from src.state import ContainerStateManager
+    from src.models import ContainerInfo
+
+    state = ContainerStateManager()
+    state.update(ContainerInfo("my_app", "running", None, "img", None))
+
+    docker_client = MagicMock()
+    docker_client.containers.get.return_value.logs.return_value = b"run ```rm``` now\n"
+
+    handler = logs_command(state, docker_client)
+
+    message = MagicMock()
+    message.text = "/logs my_app"
+    message.answer = AsyncMock()
+
+    await handler(message)
+
+    response = message.answer.call_args[0][0]
+    assert message.answer.call_args.kwargs["parse_mode"] == "MarkdownV2"
+    assert "*Logs: my\\_app* \\(last 20 lines\\)" in response
+    assert "run \\`\\`\\`rm\\`\\`\\` now" in response
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+import time
 
 
 def test_confirmation_manager_stores_pending():
@@ -43,7 +43,7 @@ def test_confirmation_manager_expired_not_returned():
     manager._pending[123] = PendingConfirmation(
         action="restart",
         container_name="radarr",
-        expires_at=datetime.now() - timedelta(seconds=1),
+        expires_at=time.monotonic() - 1,
     )
 
     assert manager.get_pending(123) is None
@@ -76,3 +76,21 @@ def test_confirmation_manager_users_independent():
 
     assert pending_123.container_name == "radarr"
     assert pending_456.container_name == "sonarr"
+
+
+def test_confirmation_manager_evicts_other_users_expired():
+    """Test that expired confirmations are evicted even if never read."""
+    from unittest.mock import patch
+    from src.bot.confirmation import ConfirmationManager
+
+    manager = ConfirmationManager(timeout_seconds=60)
+    start = time.monotonic()
+
+    with patch("src.bot.confirmation.time.monotonic", return_value=start):
+        manager.request(user_id=123, action="restart", container_name="radarr")
+
+    with patch("src.bot.confirmation.time.monotonic", return_value=start + 120):
+        manager.request(user_id=456, action="stop", container_name="sonarr")
+
+    assert 123 not in manager._pending
+    assert manager.get_pending(456) is not None
@@ -115,3 +115,44 @@ async def test_docker_monitor_respects_ignored_containers():
     await monitor._handle_crash_event(event)
 
     bot.send_message.assert_not_called()
+
+
+def test_docker_monitor_reconnect_keeps_shared_client():
+    from src.monitors.docker_events import DockerEventMonitor
+    from src.state import ContainerStateManager
+
+    monitor = DockerEventMonitor(state_manager=ContainerStateManager())
+    client = MagicMock()
+    client.containers.list.return_value = []
+    monitor._client = client
+
+    monitor._reconnect()
+
+    assert monitor._client is client
+    client.ping.assert_called_once()
+    client.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_docker_monitor_sends_queued_crash_burst():
+    import asyncio
+    from src.monitors.docker_events import DockerEventMonitor
+    from src.state import ContainerStateManager
+
+    alert_manager = MagicMock()
+    alert_manager.send_crash_alert = AsyncMock()
+    monitor = DockerEventMonitor(state_manager=ContainerStateManager(), alert_manager=alert_manager)
+
+    for name in ("radarr", "sonarr", "lidarr"):
+        monitor._pending_alerts.put_nowait(
+            {"Action": "die", "Actor": {"Attributes": {"name": name, "exitCode": "1"}}}
+        )
+
+    monitor._running = True
+    task = asyncio.create_task(monitor._process_alerts())
+    await asyncio.sleep(0.05)
+    monitor._running = False
+    await task
+
+    sent = {c.kwargs["container_name"] for c in alert_manager.send_crash_alert.call_args_list}
+    assert sent == {"radarr", "sonarr", "lidarr"}
@@ -33,3 +33,56 @@ def test_format_bytes_large_values():
 
     assert format_bytes(8_589_934_592) == "8.0GB"  # 8 GB
     assert format_bytes(16_000_000_000) == "14.9GB"  # ~15 GB
+
+
+def test_decode_log_tail_short_output_unchanged():
+    """Test decode_log_tail leaves short output intact."""
+    from src.utils.formatting import decode_log_tail
+
+    assert decode_log_tail(b"line 1\nline 2\n", 100) == ("line 1\nline 2\n", False)
+
+
+def test_decode_log_tail_matches_full_decode():
+    """Test decode_log_tail keeps the same tail as decoding everything."""
+    from src.utils.formatting import decode_log_tail
+
+    log_bytes = ("é€😀 line\n" * 500).encode("utf-8")
+
+    text, truncated = decode_log_tail(log_bytes, 100)
+
+    assert truncated is True
+    assert text == log_bytes.decode("utf-8")[-100:]
+
+
+def test_escape_markdown_v2_code():
+    """Test only backslashes and backticks are escaped for code blocks."""
+    from src.utils.formatting import escape_markdown_v2_code
+
+    assert escape_markdown_v2_code("a_b *c* ```d``` C:\\tmp") == "a_b *c* \\`\\`\\`d\\`\\`\\` C:\\\\tmp"
+
+
+def test_escape_markdown():
+    """Test legacy Markdown entity characters are backslash-escaped."""
+    from src.utils.formatting import escape_markdown
+
+    assert escape_markdown("db_conn *failed* at `x` [1]") == "db\\_conn \\*failed\\* at \\`x\\` \\[1]"
+    assert escape_markdown("plain text") == "plain text"
+
+
+def test_format_clock_time():
+    """Test clock time matches strftime("%H:%M")."""
+    from datetime import datetime
+    from src.utils.formatting import format_clock_time
+
+    for dt in (datetime(2024, 1, 1, 0, 5), datetime(2024, 1, 1, 9, 30), datetime(2024, 1, 1, 23, 59)):
+        assert format_clock_time(dt) == dt.strftime("%H:%M")
+
+
+def test_markdown_code_and_italic_fall_back_to_escaped_text():
+    """Test entities are only used when the text cannot break them."""
+    from src.utils.formatting import markdown_code, markdown_italic
+
+    assert markdown_code("conn_*refused*") == "`conn_*refused*`"
+    assert markdown_code("use `x`") == "use \\`x\\`"
+    assert markdown_italic("Timeout errors") == "_Timeout errors_"
+    assert markdown_italic("db_conn *errors*") == "db\\_conn \\*errors\\*"
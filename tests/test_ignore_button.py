@@ -146,8 +146,9 @@ class TestIgnoreSimilarCallback:
 
         await handler(callback)
 
-        # Verify analyzer was called
+        # Verify analyzer was called, with the press acknowledged only once
         mock_analyzer.analyze_error.assert_called_once()
+        callback.answer.assert_called_once_with("Analyzing error...")
 
         # Verify regex pattern was added
         ignores = ignore_manager.get_all_ignores("sonarr")
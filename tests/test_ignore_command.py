@@ -131,6 +131,40 @@ async def test_ignore_selection_saves_ignore():
     assert manager.is_ignored("plex", "Error message 1 happened")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("1, 2", "Ignored for plex"),
+        ("All", "Ignored for plex"),
+        ("3", "Invalid selection"),
+        ("0", "Invalid selection"),
+        ("1,,2", "Invalid input"),
+        ("one", "Invalid input"),
+    ],
+)
+async def test_ignore_selection_parsing(tmp_path, text, expected):
+    """Test selection input is validated before anything is ignored."""
+    from src.bot.ignore_command import ignore_selection_handler, IgnoreSelectionState
+    from src.alerts.ignore_manager import IgnoreManager
+
+    manager = IgnoreManager({}, json_path=str(tmp_path / "ignores.json"))
+    selection_state = IgnoreSelectionState()
+    selection_state.set_pending(123, "plex", ["Error message 1", "Error message 2"])
+
+    handler = ignore_selection_handler(manager, selection_state)
+
+    message = MagicMock()
+    message.text = text
+    message.answer = AsyncMock()
+    message.from_user = MagicMock()
+    message.from_user.id = 123
+
+    await handler(message)
+
+    assert expected in message.answer.call_args[0][0]
+
+
 @pytest.mark.asyncio
 async def test_ignores_command_lists_all():
     """Test /ignores lists all ignores."""
@@ -231,3 +265,107 @@ class TestIgnoreWithAnalysis:
         assert len(ignores) == 1
         assert ignores[0][0] == "Connection refused to .* on port \\d+"
         assert ignores[0][2] == "Connection refused errors"
+
+    @pytest.mark.asyncio
+    async def test_ignore_selection_analyzes_errors_concurrently(self, tmp_path):
+        import asyncio
+        from src.bot.ignore_command import ignore_selection_handler, IgnoreSelectionState
+        from src.alerts.ignore_manager import IgnoreManager
+        from unittest.mock import AsyncMock, MagicMock
+
+        ignore_manager = IgnoreManager({}, str(tmp_path / "ignores.json"))
+        selection_state = IgnoreSelectionState()
+        selection_state.set_pending(123, "sonarr", ["Error one", "Error two", "Error three"])
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def analyze_error(container, error_message, recent_logs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if error_message == "Error two":
+                return None
+            return {"pattern": error_message, "match_type": "substring", "explanation": "x"}
+
+        mock_analyzer = MagicMock()
+        mock_analyzer.analyze_error = analyze_error
+
+        message = MagicMock()
+        message.from_user = MagicMock()
+        message.from_user.id = 123
+        message.text = "all"
+        message.answer = AsyncMock()
+
+        handler = ignore_selection_handler(ignore_manager, selection_state, mock_analyzer)
+        await handler(message)
+
+        assert max_in_flight == 3
+        # Results are applied in selection order; failed analysis falls back
+        ignores = ignore_manager.get_all_ignores("sonarr")
+        assert [pattern for pattern, _, _ in ignores] == ["Error one", "Error two", "Error three"]
+
+    @pytest.mark.asyncio
+    async def test_ignore_selection_skips_repeated_numbers(self, tmp_path):
+        from src.bot.ignore_command import ignore_selection_handler, IgnoreSelectionState
+        from src.alerts.ignore_manager import IgnoreManager
+        from unittest.mock import AsyncMock, MagicMock
+
+        ignore_manager = IgnoreManager({}, str(tmp_path / "ignores.json"))
+        selection_state = IgnoreSelectionState()
+        selection_state.set_pending(123, "sonarr", ["Error one", "Error two", "Error three"])
+
+        mock_analyzer = MagicMock()
+        mock_analyzer.analyze_error = AsyncMock(return_value=None)
+
+        message = MagicMock()
+        message.from_user = MagicMock()
+        message.from_user.id = 123
+        message.text = "3,1,3,1"
+        message.answer = AsyncMock()
+
+        handler = ignore_selection_handler(ignore_manager, selection_state, mock_analyzer)
+        await handler(message)
+
+        analyzed = [call.kwargs["error_message"] for call in mock_analyzer.analyze_error.call_args_list]
+        assert analyzed == ["Error three", "Error one"]
+
+
+def test_ignore_selection_state_expires():
+    """Test pending selections are dropped after the timeout."""
+    from unittest.mock import patch
+    from src.bot.ignore_command import IgnoreSelectionState
+
+    selection_state = IgnoreSelectionState(timeout_seconds=300)
+
+    with patch("src.bot.ignore_command.time.monotonic", return_value=1000.0):
+        selection_state.set_pending(123, "plex", ["Error message 1"])
+        selection_state.set_pending(456, "plex", ["Error message 2"])
+    with patch("src.bot.ignore_command.time.monotonic", return_value=1200.0):
+        selection_state.set_pending(456, "radarr", ["Error message 3"])
+
+    with patch("src.bot.ignore_command.time.monotonic", return_value=1301.0):
+        assert not selection_state.has_pending(123)
+        # Replaced selection keeps its newer deadline
+        assert selection_state.get_pending(456) == ("radarr", ["Error message 3"])
+
+    assert 123 not in selection_state.pending_selections
+
+
+def test_ignore_selection_state_evicts_oldest(monkeypatch):
+    """Test pending selections are capped, dropping the least recently set."""
+    from src.bot.ignore_command import IgnoreSelectionState
+
+    monkeypatch.setattr("src.bot.ignore_command.MAX_PENDING_SELECTIONS", 2)
+    selection_state = IgnoreSelectionState()
+
+    selection_state.set_pending(1, "plex", ["Error 1"])
+    selection_state.set_pending(2, "plex", ["Error 2"])
+    selection_state.set_pending(1, "plex", ["Error 3"])
+    selection_state.set_pending(3, "plex", ["Error 4"])
+
+    assert not selection_state.has_pending(2)
+    assert selection_state.get_pending(1) == ("plex", ["Error 3"])
+    assert selection_state.has_pending(3)
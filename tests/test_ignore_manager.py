@@ -248,3 +248,108 @@ class TestIgnorePatternFormat:
         runtime_ignore = [i for i in ignores if i[1] == "runtime"][0]
         assert runtime_ignore[0] == "runtime pattern"
         assert runtime_ignore[2] == "Test explanation"
+
+    def test_saved_format_excludes_cached_fields(self, tmp_path):
+        """Test that the cached lowercase pattern is not persisted."""
+        from src.alerts.ignore_manager import IgnoreManager
+
+        json_path = tmp_path / "ignores.json"
+        manager = IgnoreManager(config_ignores={}, json_path=str(json_path))
+        manager.add_ignore_pattern("plex", "Mixed Case Pattern")
+
+        saved = json.loads(json_path.read_text())
+        assert set(saved["plex"][0]) == {"pattern", "match_type", "explanation", "added"}
+        assert manager.is_ignored("plex", "found MIXED case pattern here")
+
+    def test_matchers_refresh_after_add_and_remove(self, tmp_path):
+        """Test that cached matchers pick up added and removed patterns."""
+        from src.alerts.ignore_manager import IgnoreManager
+
+        json_path = tmp_path / "ignores.json"
+        manager = IgnoreManager(config_ignores={"plex": ["config pattern"]}, json_path=str(json_path))
+
+        assert not manager.is_ignored("plex", "runtime pattern seen")
+        manager.add_ignore_pattern("plex", "runtime pattern")
+        manager.add_ignore_pattern("plex", "code \\d+", match_type="regex")
+        assert manager.is_ignored("plex", "runtime pattern seen")
+        assert manager.is_ignored("plex", "Code 42")
+        assert manager.is_ignored("plex", "CONFIG PATTERN")
+
+        manager.remove_runtime_ignore("plex", 0)
+        assert not manager.is_ignored("plex", "runtime pattern seen")
+        assert manager.is_ignored("plex", "Code 42")
+
+    def test_get_containers_sorted_and_refreshed(self, tmp_path):
+        """Test containers from config and runtime are listed in order."""
+        from src.alerts.ignore_manager import IgnoreManager
+
+        json_path = tmp_path / "ignores.json"
+        manager = IgnoreManager(config_ignores={"sonarr": ["timeout"]}, json_path=str(json_path))
+
+        assert manager.get_containers() == ("sonarr",)
+        manager.add_ignore_pattern("plex", "runtime pattern")
+        assert manager.get_containers() == ("plex", "sonarr")
+        manager.remove_runtime_ignore("plex", 0)
+        assert manager.get_containers() == ("sonarr",)
+
+    def test_get_runtime_ignore_counts(self, tmp_path):
+        """Test counts cover only containers with runtime ignores."""
+        from src.alerts.ignore_manager import IgnoreManager
+
+        json_path = tmp_path / "ignores.json"
+        manager = IgnoreManager(config_ignores={"sonarr": ["timeout"]}, json_path=str(json_path))
+        manager.add_ignore_pattern("plex", "first")
+        manager.add_ignore_pattern("plex", "second")
+        manager.add_ignore_pattern("radarr", "third")
+
+        assert manager.get_runtime_ignore_counts() == {"plex": 2, "radarr": 1}
+
+    def test_multiple_regex_patterns_and_invalid_regex(self, tmp_path):
+        """Test combined regex matching, group patterns, and invalid regex skipping."""
+        from src.alerts.ignore_manager import IgnoreManager
+
+        json_path = tmp_path / "ignores.json"
+        manager = IgnoreManager(config_ignores={}, json_path=str(json_path))
+
+        manager.add_ignore_pattern("plex", "timeout after \\d+s", match_type="regex")
+        manager.add_ignore_pattern("plex", "[unclosed", match_type="regex")
+        manager.add_ignore_pattern("plex", "^warn", match_type="regex")
+        manager.add_ignore_pattern("plex", "(ab)c\\1", match_type="regex")
+
+        assert manager.is_ignored("plex", "Request TIMEOUT after 30s")
+        assert manager.is_ignored("plex", "WARN: disk slow")
+        assert manager.is_ignored("plex", "xx abcab yy")
+        assert not manager.is_ignored("plex", "error: warn later")
+        assert not manager.is_ignored("plex", "abcxy")
+
+
+class TestIgnorePatternMatches:
+    """Tests for IgnorePattern.matches."""
+
+    def test_regex_compiled_once(self):
+        """Regex patterns are compiled at construction and reused."""
+        from src.alerts.ignore_manager import IgnorePattern
+
+        pattern = IgnorePattern(pattern="code \\d+", match_type="regex")
+
+        assert pattern._compiled is not None
+        assert pattern.matches("Error CODE 500")
+        assert not pattern.matches("Error code abc")
+
+    def test_invalid_regex_never_matches(self):
+        """Invalid regex patterns are stored uncompiled and never match."""
+        from src.alerts.ignore_manager import IgnorePattern
+
+        pattern = IgnorePattern(pattern="[unclosed", match_type="regex")
+
+        assert pattern._compiled is None
+        assert not pattern.matches("[unclosed")
+
+    def test_substring_uses_precomputed_lowercase(self):
+        """Substring patterns match case-insensitively with or without message_lower."""
+        from src.alerts.ignore_manager import IgnorePattern
+
+        pattern = IgnorePattern(pattern="Disk FULL")
+
+        assert pattern.matches("WARNING: disk full")
+        assert pattern.matches("WARNING: disk full", "warning: disk full")
@@ -202,6 +202,29 @@ async def test_manage_selection_removes_mute(ignore_manager, mute_manager, manag
     assert len(mute_manager.get_active_mutes()) == 0
 
 
+@pytest.mark.asyncio
+async def test_manage_selection_removes_array_mute(ignore_manager, mute_manager, manage_state, tmp_path):
+    """Test selecting an array mute unmutes it via ArrayMuteManager."""
+    from src.alerts.array_mute_manager import ArrayMuteManager
+
+    array_mute_manager = ArrayMuteManager(str(tmp_path / "array_mutes.json"))
+    array_mute_manager.mute_array(timedelta(hours=1))
+    manage_state.set_pending_mute(123, [("array", "array")])
+
+    handler = manage_selection_handler(
+        ignore_manager, mute_manager, None, array_mute_manager, manage_state
+    )
+    message = AsyncMock()
+    message.text = "1"
+    message.from_user = MagicMock()
+    message.from_user.id = 123
+
+    await handler(message)
+
+    assert "Array alerts unmuted" in message.answer.call_args.args[0]
+    assert not array_mute_manager.is_array_muted()
+
+
 @pytest.mark.asyncio
 async def test_manage_selection_cancel(ignore_manager, mute_manager, manage_state):
     """Test cancel clears pending state."""
@@ -284,3 +307,19 @@ def test_manage_command_in_help():
     """Test /manage is listed in help."""
     from src.bot.commands import HELP_TEXT
     assert "/manage" in HELP_TEXT
+
+
+def test_manage_selection_state_evicts_oldest(monkeypatch, manage_state):
+    """Test pending selections are capped, dropping the least recently set."""
+    monkeypatch.setattr("src.bot.manage_command.MAX_PENDING_SELECTIONS", 2)
+
+    manage_state.set_pending_mute(1, [("container", "plex")])
+    manage_state.set_pending_mute(2, [("container", "radarr")])
+    # Setting again refreshes user 1, so user 2 is now the oldest
+    manage_state.set_pending_mute(1, [("container", "sonarr")])
+    manage_state.set_pending_mute(3, [("server", "cpu")])
+
+    assert manage_state.get_pending_mute(2) is None
+    assert manage_state.get_pending_mute(1) == [("container", "sonarr")]
+    assert manage_state.get_pending_mute(3) == [("server", "cpu")]
+
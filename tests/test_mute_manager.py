@@ -55,7 +55,7 @@ def test_mute_manager_expiry(tmp_path):
     manager = MuteManager(json_path=str(json_file))
 
     # Add expired mute manually
-    manager._mutes["plex"] = datetime.now() - timedelta(minutes=5)
+    manager._mutes["plex"] = (datetime.now() - timedelta(minutes=5)).timestamp()
 
     assert not manager.is_muted("plex")
 
@@ -110,3 +110,59 @@ def test_mute_manager_get_active_mutes(tmp_path):
     containers = {m[0] for m in mutes}
     assert "plex" in containers
     assert "radarr" in containers
+
+
+def test_mute_manager_loads_legacy_iso_format(tmp_path):
+    """Test that mutes saved as ISO datetime strings still load."""
+    import json
+    from src.alerts.mute_manager import MuteManager
+
+    json_file = tmp_path / "mutes.json"
+    expiry = datetime.now() + timedelta(hours=1)
+    json_file.write_text(json.dumps({"plex": expiry.isoformat()}))
+
+    manager = MuteManager(json_path=str(json_file))
+
+    assert manager.is_muted("plex")
+    mutes = manager.get_active_mutes()
+    assert mutes[0][0] == "plex"
+    assert abs((mutes[0][1] - expiry).total_seconds()) < 1
+
+
+def test_get_active_mutes_drops_expired_and_keeps_remuted(tmp_path):
+    """Test expired mutes are cleaned while re-muted keys survive."""
+    from unittest.mock import patch
+    from src.alerts.mute_manager import MuteManager
+
+    json_file = tmp_path / "mutes.json"
+    manager = MuteManager(json_path=str(json_file))
+    start = datetime.now().timestamp()
+
+    with patch.object(MuteManager, "_now", return_value=start):
+        manager.add_mute("plex", timedelta(minutes=10))
+        manager.add_mute("radarr", timedelta(minutes=10))
+        # Re-mute radarr for longer; the old heap entry becomes stale
+        manager.add_mute("radarr", timedelta(hours=2))
+
+    with patch.object(MuteManager, "_now", return_value=start + 3600):
+        mutes = manager.get_active_mutes()
+
+    assert [name for name, _ in mutes] == ["radarr"]
+    assert "plex" not in manager._mutes
+
+
+def test_unchanged_state_is_not_rewritten(tmp_path):
+    """Test that saving identical state skips the file write."""
+    from unittest.mock import patch
+    from src.alerts.mute_manager import MuteManager
+
+    json_file = tmp_path / "mutes.json"
+    manager = MuteManager(json_path=str(json_file))
+    manager.add_mute("plex", timedelta(hours=1))
+
+    with patch("src.utils.persistence.atomic_write_bytes") as mock_write:
+        manager._save()
+        mock_write.assert_not_called()
+
+        manager.remove_mute("plex")
+        mock_write.assert_called_once()
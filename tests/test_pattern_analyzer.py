@@ -1,12 +1,13 @@
 """Tests for Haiku-based pattern analysis."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 
 @pytest.fixture
 def mock_anthropic_client():
     client = MagicMock()
+    client.messages.create = AsyncMock()
     return client
 
 
@@ -78,3 +79,100 @@ class TestPatternAnalyzer:
         )
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_analyze_falls_back_to_substring_for_invalid_regex(self, mock_anthropic_client):
+        from src.analysis.pattern_analyzer import PatternAnalyzer
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock()]
+        mock_response.content[0].text = '''{
+    "pattern": "Timeout after (\\\\d+ seconds",
+    "match_type": "regex",
+    "explanation": "Timeout errors"
+}'''
+        mock_anthropic_client.messages.create.return_value = mock_response
+
+        analyzer = PatternAnalyzer(mock_anthropic_client)
+
+        result = await analyzer.analyze_error(
+            container="app",
+            error_message="Timeout after 30 seconds",
+            recent_logs=[],
+        )
+
+        assert result["pattern"] == "Timeout after (\\d+ seconds"
+        assert result["match_type"] == "substring"
+
+    @pytest.mark.asyncio
+    async def test_analyze_uses_last_context_lines_from_deque(self, mock_anthropic_client):
+        from collections import deque
+        from src.analysis.pattern_analyzer import PatternAnalyzer
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock()]
+        mock_response.content[0].text = '{"pattern": "x", "match_type": "substring", "explanation": "x"}'
+        mock_anthropic_client.messages.create.return_value = mock_response
+
+        analyzer = PatternAnalyzer(mock_anthropic_client, context_lines=2)
+
+        await analyzer.analyze_error(
+            container="app",
+            error_message="x",
+            recent_logs=deque(["line 1", "line 2", "line 3"]),
+        )
+
+        prompt = mock_anthropic_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert "line 2\nline 3" in prompt
+        assert "line 1" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_analyze_handles_braces_in_response(self, mock_anthropic_client):
+        from src.analysis.pattern_analyzer import PatternAnalyzer
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock()]
+        mock_response.content[0].text = '''Here is the pattern {as requested}:
+{
+    "pattern": "Retry \\\\d{1,3} of \\\\d+",
+    "match_type": "regex",
+    "explanation": "Retry attempts",
+    "meta": {"confidence": "high"}
+}'''
+        mock_anthropic_client.messages.create.return_value = mock_response
+
+        analyzer = PatternAnalyzer(mock_anthropic_client)
+
+        result = await analyzer.analyze_error(
+            container="app",
+            error_message="Retry 3 of 5",
+            recent_logs=[],
+        )
+
+        assert result["pattern"] == "Retry \\d{1,3} of \\d+"
+        assert result["match_type"] == "regex"
+
+    @pytest.mark.asyncio
+    async def test_prompt_matches_template(self, mock_anthropic_client):
+        from src.analysis.pattern_analyzer import ANALYSIS_PROMPT, PatternAnalyzer, _PROMPT_FIELDS
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock()]
+        mock_response.content[0].text = '{"pattern": "x", "match_type": "substring", "explanation": "x"}'
+        mock_anthropic_client.messages.create.return_value = mock_response
+
+        analyzer = PatternAnalyzer(mock_anthropic_client)
+
+        await analyzer.analyze_error(
+            container="app",
+            error_message="Error {with braces}",
+            recent_logs=["line 1"],
+        )
+
+        prompt = mock_anthropic_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert _PROMPT_FIELDS == ("container", "error_message", "recent_logs")
+        assert prompt == ANALYSIS_PROMPT.format(
+            container="app",
+            error_message="Error {with braces}",
+            recent_logs="line 1",
+        )
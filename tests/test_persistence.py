@@ -0,0 +1,155 @@
+"""Tests for persistence utilities."""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.utils import persistence
+from src.utils.persistence import DebouncedSaver, atomic_write_bytes, dumps_json, loads_json
+
+
+class TestJsonHelpers:
+    """Tests for dumps_json / loads_json."""
+
+    def test_round_trip(self):
+        """Data survives a dumps/loads round trip as compact bytes."""
+        data = {"plex": [{"pattern": "caf\u00e9 error", "added": None}]}
+
+        payload = dumps_json(data)
+
+        assert isinstance(payload, bytes)
+        assert payload.startswith(b'{"plex":[{"pattern":')
+        assert loads_json(payload) == data
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Falls back to stdlib json when orjson is unavailable."""
+        monkeypatch.setattr(persistence, "orjson", None)
+        data = {"array": "2026-01-01T00:00:00"}
+
+        payload = dumps_json(data)
+
+        assert payload == b'{"array":"2026-01-01T00:00:00"}'
+        assert loads_json(payload) == data
+
+
+class TestDebouncedSaver:
+    """Tests for the DebouncedSaver class."""
+
+    def test_writes_immediately_without_event_loop(self, tmp_path):
+        """Outside an event loop, requests are written straight away."""
+        target = tmp_path / "state.json"
+        saver = DebouncedSaver(target, lambda: b"{}")
+
+        saver.request()
+
+        assert target.read_bytes() == b"{}"
+        assert not saver.pending
+
+    @pytest.mark.asyncio
+    async def test_coalesces_requests_in_event_loop(self, tmp_path):
+        """Multiple requests inside a loop result in one deferred write."""
+        target = tmp_path / "state.json"
+        encode = MagicMock(return_value=b"{}")
+        saver = DebouncedSaver(target, encode, delay=0.01)
+
+        saver.request()
+        saver.request()
+        saver.request()
+        assert saver.pending
+        assert not target.exists()
+
+        await asyncio.sleep(0.1)
+
+        encode.assert_called_once()
+        assert target.read_bytes() == b"{}"
+        assert not saver.pending
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_pending_and_cancels_timer(self, tmp_path):
+        """flush() writes pending changes once and cancels the scheduled write."""
+        target = tmp_path / "state.json"
+        encode = MagicMock(return_value=b"{}")
+        saver = DebouncedSaver(target, encode, delay=0.01)
+
+        saver.request()
+        saver.flush()
+        assert target.read_bytes() == b"{}"
+
+        await asyncio.sleep(0.05)
+        encode.assert_called_once()
+
+    def test_flush_without_changes_does_not_write(self, tmp_path):
+        """flush() is a no-op when nothing is pending."""
+        encode = MagicMock(return_value=b"{}")
+        saver = DebouncedSaver(tmp_path / "state.json", encode)
+
+        saver.flush()
+
+        encode.assert_not_called()
+
+    def test_skips_unchanged_payload(self, tmp_path, monkeypatch):
+        """A payload equal to the last persisted one is not rewritten."""
+        write = MagicMock()
+        monkeypatch.setattr(persistence, "atomic_write_bytes", write)
+        saver = DebouncedSaver(tmp_path / "state.json", lambda: b"{}")
+        saver.mark_persisted(b"{}")
+
+        saver.request()
+
+        write.assert_not_called()
+
+    def test_older_payload_never_overwrites_newer(self, tmp_path):
+        """A write that finishes late is dropped if a newer one already landed."""
+        target = tmp_path / "state.json"
+        state = {"payload": b"1"}
+        saver = DebouncedSaver(target, lambda: state["payload"])
+
+        saver._dirty = True
+        first = saver._take_payload()
+        state["payload"] = b"2"
+        saver._dirty = True
+        second = saver._take_payload()
+
+        saver._write_payload(*second)
+        saver._write_payload(*first)
+
+        assert target.read_bytes() == b"2"
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Existing content is replaced and no temp file is left behind."""
+        target = tmp_path / "state.json"
+        target.write_bytes(b"old")
+
+        atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failure_keeps_original(self, tmp_path, monkeypatch):
+        """A failed replace leaves the original file intact."""
+        target = tmp_path / "state.json"
+        target.write_bytes(b"old")
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(persistence.os, "replace", fail_replace)
+
+        with pytest.raises(OSError):
+            atomic_write_bytes(target, b"new")
+
+        assert target.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_recreates_missing_parent_directory(self, tmp_path):
+        """A parent directory removed after startup is recreated."""
+        target = tmp_path / "data" / "state.json"
+
+        atomic_write_bytes(target, b"{}")
+
+        assert target.read_bytes() == b"{}"
@@ -85,7 +85,7 @@ async def test_protected_container_rejected():
 @pytest.mark.asyncio
 async def test_confirmation_timeout():
     """Test: Expired confirmation is rejected."""
-    from datetime import datetime, timedelta
+    import time
     from src.bot.control_commands import create_confirm_handler
     from src.bot.confirmation import ConfirmationManager, PendingConfirmation
     from src.services.container_control import ContainerController
@@ -98,7 +98,7 @@ async def test_confirmation_timeout():
     confirmation._pending[123] = PendingConfirmation(
         action="restart",
         container_name="radarr",
-        expires_at=datetime.now() - timedelta(seconds=1),
+        expires_at=time.monotonic() - 1,
     )
 
     handler = create_confirm_handler(controller, confirmation)
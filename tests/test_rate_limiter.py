@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+import time
 
 
 def test_rate_limiter_allows_first_event():
@@ -26,7 +26,8 @@ def test_rate_limiter_allows_after_cooldown():
     limiter = RateLimiter(cooldown_seconds=900)
 
     # Simulate alert 20 minutes ago
-    limiter._last_alert["radarr"] = datetime.now() - timedelta(minutes=20)
+    limiter.record_alert("radarr")
+    limiter._entries["radarr"].last_alert = time.monotonic() - 20 * 60
 
     assert limiter.should_alert("radarr") is True
 
@@ -64,9 +65,32 @@ def test_rate_limiter_resets_suppressed_on_alert():
     limiter.record_suppressed("radarr")
 
     # Simulate cooldown expired
-    limiter._last_alert["radarr"] = datetime.now() - timedelta(minutes=20)
+    limiter._entries["radarr"].last_alert = time.monotonic() - 20 * 60
 
     # This should reset the suppressed count
     limiter.record_alert("radarr")
 
     assert limiter.get_suppressed_count("radarr") == 0
+
+
+def test_rate_limiter_sweeps_idle_entries():
+    from src.alerts.rate_limiter import RateLimiter, SWEEP_INTERVAL
+
+    limiter = RateLimiter(cooldown_seconds=900)
+
+    limiter.record_alert("radarr")
+    limiter.record_alert("sonarr")
+    limiter.record_alert("lidarr")
+    limiter.record_suppressed("lidarr")
+    # radarr and lidarr went quiet hours ago; force the next call to sweep
+    limiter._entries["radarr"].last_alert = time.monotonic() - 5 * 900
+    limiter._entries["lidarr"].last_alert = time.monotonic() - 5 * 900
+    limiter._last_sweep -= SWEEP_INTERVAL
+
+    limiter.record_suppressed("sonarr")
+
+    assert "radarr" not in limiter._entries
+    assert limiter.get_suppressed_count("sonarr") == 1
+    assert limiter.should_alert("radarr") is True
+    # Suppressed counts survive the sweep for the next alert to report
+    assert limiter.get_suppressed_count("lidarr") == 1
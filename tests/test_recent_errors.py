@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+import time
 
 
 def test_recent_errors_buffer_add_and_get():
@@ -44,11 +44,11 @@ def test_recent_errors_buffer_expires_old():
     buffer = RecentErrorsBuffer(max_age_seconds=60)
 
     # Add an error with old timestamp (manually for testing)
-    buffer._errors["plex"] = []
-    from src.alerts.recent_errors import RecentError
-    old_time = datetime.now() - timedelta(seconds=120)
-    buffer._errors["plex"].append(RecentError(message="Old error", timestamp=old_time))
-    buffer._errors["plex"].append(RecentError(message="New error", timestamp=datetime.now()))
+    from collections import OrderedDict
+    old_time = time.monotonic() - 120
+    buffer._errors["plex"] = OrderedDict(
+        [("Old error", old_time), ("New error", time.monotonic())]
+    )
 
     errors = buffer.get_recent("plex")
     assert len(errors) == 1
@@ -77,3 +77,33 @@ def test_recent_errors_buffer_empty_container():
 
     errors = buffer.get_recent("unknown")
     assert errors == []
+
+
+def test_recent_errors_buffer_repeated_error_refreshes_position():
+    """Test that a repeated error is kept once and moves to the newest end."""
+    from src.alerts.recent_errors import RecentErrorsBuffer
+
+    buffer = RecentErrorsBuffer(max_per_container=2)
+
+    buffer.add("plex", "Error A")
+    buffer.add("plex", "Error B")
+    buffer.add("plex", "Error A")
+    buffer.add("plex", "Error C")
+
+    # B was least recently seen, so it is evicted first
+    assert buffer.get_recent("plex") == ["Error A", "Error C"]
+
+
+def test_recent_errors_buffer_find_by_prefix():
+    """Test recovering a full error from a truncated preview."""
+    from src.alerts.recent_errors import RecentErrorsBuffer
+
+    buffer = RecentErrorsBuffer()
+
+    buffer.add("plex", "Connection refused to db")
+    buffer.add("plex", "Connection reset by peer")
+
+    assert buffer.find_by_prefix("plex", "Connection re") == "Connection refused to db"
+    assert buffer.find_by_prefix("plex", "Connection res") == "Connection reset by peer"
+    assert buffer.find_by_prefix("plex", "Timeout") is None
+    assert buffer.find_by_prefix("radarr", "Connection") is None
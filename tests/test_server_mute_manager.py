@@ -87,3 +87,28 @@ def test_server_mute_manager_get_active_mutes(tmp_path):
     categories = {m[0] for m in mutes}
     assert "server" in categories
     assert "array" in categories
+
+
+def test_server_mute_manager_unmute_expired(tmp_path):
+    """Test unmuting a mute that has already expired reports not muted."""
+    from unittest.mock import patch
+    from src.alerts.server_mute_manager import ServerMuteManager
+
+    json_file = tmp_path / "server_mutes.json"
+    manager = ServerMuteManager(json_path=str(json_file))
+    start = manager._now()
+
+    with patch.object(ServerMuteManager, "_now", return_value=start):
+        manager.mute_array(timedelta(minutes=1))
+        manager.mute_ups(timedelta(minutes=1))
+
+    with patch.object(ServerMuteManager, "_now", return_value=start + 120):
+        assert not manager.is_array_muted()
+        assert manager.unmute_array() is False
+        assert manager.unmute_ups() is False
+
+    with patch.object(ServerMuteManager, "_now", return_value=start):
+        manager.mute_server(timedelta(minutes=1))
+
+    with patch.object(ServerMuteManager, "_now", return_value=start + 120):
+        assert manager.unmute_server() is False
@@ -69,6 +69,19 @@ def test_state_manager_find_by_name_exact_match_priority():
     assert matches[0].name == "Plex-Rewind"
 
 
+def test_state_manager_find_by_name_is_case_insensitive_and_sees_updates():
+    from src.state import ContainerStateManager
+    from src.models import ContainerInfo
+
+    manager = ContainerStateManager()
+    manager.update(ContainerInfo("Radarr", "running", None, "img", None))
+    manager.update(ContainerInfo("Radarr", "exited", None, "img", None))
+
+    matches = manager.find_by_name("RADARR")
+    assert len(matches) == 1
+    assert matches[0].status == "exited"
+
+
 def test_state_manager_summary():
     from src.state import ContainerStateManager
     from src.models import ContainerInfo
@@ -83,3 +96,20 @@ def test_state_manager_summary():
     assert summary["running"] == 3
     assert summary["stopped"] == 1
     assert summary["unhealthy"] == 1
+
+
+def test_state_manager_find_by_name_cache_sees_new_containers():
+    from src.state import ContainerStateManager
+    from src.models import ContainerInfo
+
+    manager = ContainerStateManager()
+    manager.update(ContainerInfo("radarr", "running", None, "img", None))
+
+    assert [m.name for m in manager.find_by_name("rad")] == ["radarr"]
+
+    manager.update(ContainerInfo("radarr", "exited", None, "img", None))
+    manager.update(ContainerInfo("radarr-4k", "running", None, "img", None))
+
+    matches = manager.find_by_name("rad")
+    assert [m.name for m in matches] == ["radarr", "radarr-4k"]
+    assert matches[0].status == "exited"